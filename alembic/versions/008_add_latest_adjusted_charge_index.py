@@ -0,0 +1,33 @@
+"""add index for latest adjusted charge lookup
+
+Revision ID: 008
+Revises: 007
+Create Date: 2025-01-28 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "008"
+down_revision: Union[str, None] = "007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Matches the latest adjusted charge query: filter on contract_id and
+    # is_adjusted, order by period DESC, id DESC. The database walks the index
+    # backwards and returns the first row without sorting.
+    op.create_index(
+        "ix_charges_latest_adjusted",
+        "charges",
+        ["contract_id", "is_adjusted", "period", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_charges_latest_adjusted", table_name="charges")
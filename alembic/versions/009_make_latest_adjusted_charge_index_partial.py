@@ -0,0 +1,53 @@
+"""make the latest adjusted charge index partial on is_adjusted
+
+Revision ID: 009
+Revises: 008
+Create Date: 2025-01-28 01:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "009"
+down_revision: Union[str, None] = "008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Detect database type for the partial index predicate
+    bind = op.get_bind()
+    dialect_name = bind.dialect.name
+
+    # The predicate must match how SQLAlchemy renders `is_adjusted == True`
+    # in the latest adjusted charge query, or the planner ignores the index
+    if dialect_name == "sqlite":
+        adjusted_only = sa.text("is_adjusted = 1")
+    else:
+        adjusted_only = sa.text("is_adjusted = true")
+
+    # Only adjusted charges are indexed, so the lookup walks a much smaller
+    # B-tree; is_adjusted no longer needs to be a key column
+    op.drop_index("ix_charges_latest_adjusted", table_name="charges")
+    op.create_index(
+        "ix_charges_adjusted_only",
+        "charges",
+        ["contract_id", "period", "id"],
+        unique=False,
+        sqlite_where=adjusted_only,
+        postgresql_where=adjusted_only,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_charges_adjusted_only", table_name="charges")
+    op.create_index(
+        "ix_charges_latest_adjusted",
+        "charges",
+        ["contract_id", "is_adjusted", "period", "id"],
+        unique=False,
+    )
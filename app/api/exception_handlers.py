@@ -30,7 +30,7 @@ def domain_validation_error_handler(
     return _error_response(
         status.HTTP_400_BAD_REQUEST,
         str(exc),
-        VALIDATION_ERROR,
+        exc.code or VALIDATION_ERROR,
     )
 
 
@@ -40,7 +40,7 @@ def duplicate_resource_error_handler(
     return _error_response(
         status.HTTP_409_CONFLICT,
         str(exc),
-        DUPLICATE_RESOURCE,
+        exc.code or DUPLICATE_RESOURCE,
     )
 
 
@@ -48,7 +48,7 @@ def not_found_error_handler(_request: Request, exc: NotFoundError) -> JSONRespon
     return _error_response(
         status.HTTP_404_NOT_FOUND,
         str(exc),
-        NOT_FOUND,
+        exc.code or NOT_FOUND,
     )
 
 
@@ -56,7 +56,7 @@ def forbidden_error_handler(_request: Request, exc: ForbiddenError) -> JSONRespo
     return _error_response(
         status.HTTP_403_FORBIDDEN,
         str(exc),
-        FORBIDDEN,
+        exc.code or FORBIDDEN,
     )
 
 
@@ -64,7 +64,7 @@ def unauthorized_error_handler(_request: Request, exc: UnauthorizedError) -> JSO
     return _error_response(
         status.HTTP_401_UNAUTHORIZED,
         str(exc),
-        UNAUTHORIZED,
+        exc.code or UNAUTHORIZED,
     )
 
 
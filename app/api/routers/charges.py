@@ -41,7 +41,8 @@ def create_new_charge(
         is_visible=charge_data.is_visible,
         payment_date=charge_data.payment_date,
     )
-    return Charge.model_validate(charge)
+    # Returned as-is: response_model validates the ORM object only once
+    return charge
 
 
 @router.get("", response_model=list[Charge])
@@ -84,7 +85,7 @@ def get_all_charges(
         unpaid=unpaid,
         apartment_id=apartment,
     )
-    return [Charge.model_validate(c) for c in charges]
+    return charges
 
 
 @router.get("/latest-adjusted", response_model=Charge)
@@ -99,8 +100,7 @@ def get_latest_adjusted_charge(
     Get the latest charge with is_adjusted=True for a specific contract.
     Only admin users can access this endpoint.
     """
-    charge = get_latest_adjusted_charge_by_contract_id(db, contract_id)
-    return Charge.model_validate(charge)
+    return get_latest_adjusted_charge_by_contract_id(db, contract_id)
 
 
 @router.post("/estimate-adjustment")
@@ -137,8 +137,7 @@ def get_charge_by_id(
     - Admin and Accountant: can see any charge
     - Tenant: can only see visible charges for contracts with their user_id
     """
-    charge = get_charge_for_user(db, charge_id, current_user)
-    return Charge.model_validate(charge)
+    return get_charge_for_user(db, charge_id, current_user)
 
 
 @router.put("/{charge_id}", response_model=Charge)
@@ -155,8 +154,7 @@ def update_charge_by_id(
     To clear a field (set to null), explicitly include it with null value.
     """
     update_data = charge_data.model_dump(exclude_unset=True)
-    charge = update_charge(db, charge_id=charge_id, **update_data)
-    return Charge.model_validate(charge)
+    return update_charge(db, charge_id=charge_id, **update_data)
 
 
 @router.delete("/{charge_id}", status_code=status.HTTP_204_NO_CONTENT)
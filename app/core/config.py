@@ -14,6 +14,16 @@ class Settings(BaseSettings):
     first_admin_email: str = Field(alias="FIRST_ADMIN_EMAIL")
     first_admin_password: str = Field(alias="FIRST_ADMIN_PASSWORD")
 
+    # Password hashing (bcrypt cost factor)
+    password_hash_rounds: int = Field(
+        default=12, ge=4, le=31, alias="PASSWORD_HASH_ROUNDS"
+    )
+
+    # Decoded JWT cache TTL in seconds (0 disables the cache)
+    token_cache_ttl_seconds: int = Field(
+        default=0, ge=0, alias="TOKEN_CACHE_TTL_SECONDS"
+    )
+
     # Password Reset
     password_reset_token_expire_minutes: int = Field(
         default=60, alias="PASSWORD_RESET_TOKEN_EXPIRE_MINUTES"
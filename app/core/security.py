@@ -1,4 +1,8 @@
+import hashlib
 import re
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
@@ -8,7 +12,17 @@ from passlib.context import CryptContext
 from app.core.config import settings
 
 # Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.password_hash_rounds,
+)
+
+# Decoded token cache, keyed by the SHA-256 of the token. Each entry holds the
+# claims and the time.time() after which it must be verified again.
+_TOKEN_CACHE_MAXSIZE = 10_000
+_token_cache: OrderedDict[bytes, tuple[dict[str, Any], float]] = OrderedDict()
+_token_cache_lock = threading.Lock()
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -75,8 +89,7 @@ def create_password_reset_token(data: dict[str, Any]) -> str:
     return encoded_jwt
 
 
-def decode_token(token: str) -> dict[str, Any] | None:
-    """Decode and verify a JWT token."""
+def _decode_token(token: str) -> dict[str, Any] | None:
     try:
         payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
         return payload
@@ -84,3 +97,41 @@ def decode_token(token: str) -> dict[str, Any] | None:
         return None
     except jwt.InvalidTokenError:
         return None
+
+
+def decode_token(token: str) -> dict[str, Any] | None:
+    """
+    Decode and verify a JWT token.
+
+    When TOKEN_CACHE_TTL_SECONDS is set, valid tokens are cached for that long
+    (never past their own exp), so repeated requests with the same token skip
+    signature verification. Invalid tokens are never cached.
+    """
+    ttl = settings.token_cache_ttl_seconds
+    if not ttl:
+        return _decode_token(token)
+
+    key = hashlib.sha256(token.encode()).digest()
+    now = time.time()
+    with _token_cache_lock:
+        cached = _token_cache.get(key)
+        if cached is not None:
+            payload, valid_until = cached
+            if now < valid_until:
+                _token_cache.move_to_end(key)
+                return dict(payload)
+            del _token_cache[key]
+
+    payload = _decode_token(token)
+    if payload is None:
+        return None
+
+    valid_until = now + ttl
+    if "exp" in payload:
+        valid_until = min(valid_until, float(payload["exp"]))
+    with _token_cache_lock:
+        _token_cache[key] = (payload, valid_until)
+        _token_cache.move_to_end(key)
+        while len(_token_cache) > _TOKEN_CACHE_MAXSIZE:
+            _token_cache.popitem(last=False)
+    return dict(payload)
@@ -7,11 +7,23 @@ VALIDATION_ERROR = "VALIDATION_ERROR"
 FORBIDDEN = "FORBIDDEN"
 UNAUTHORIZED = "UNAUTHORIZED"
 
+# More specific codes, attached to individual errors via ``code=``.
+CHARGE_NOT_VISIBLE = "CHARGE_NOT_VISIBLE"
+CHARGE_PERIOD_BEFORE_CONTRACT_START = "CHARGE_PERIOD_BEFORE_CONTRACT_START"
+CHARGE_PERIOD_AFTER_CONTRACT_END = "CHARGE_PERIOD_AFTER_CONTRACT_END"
+EMAIL_NOT_CONFIGURED = "EMAIL_NOT_CONFIGURED"
+
 
 class DomainError(Exception):
-    """Base exception for domain/business logic errors."""
+    """Base exception for domain/business logic errors.
 
-    pass
+    ``code`` optionally replaces the generic code of the exception type in the
+    API response (e.g. CHARGE_NOT_VISIBLE instead of VALIDATION_ERROR).
+    """
+
+    def __init__(self, message: str = "", code: str | None = None):
+        super().__init__(message)
+        self.code = code
 
 
 class NotFoundError(DomainError):
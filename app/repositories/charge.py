@@ -1,6 +1,6 @@
 from datetime import date
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_, extract
+from sqlalchemy.orm import Session, contains_eager, joinedload
+from sqlalchemy import and_, delete, select
 
 from app.db.models.charge import Charge as ChargeModel
 from app.db.models.contract import Contract as ContractModel
@@ -19,6 +19,22 @@ def get_charge_by_id(db: Session, charge_id: int) -> ChargeModel | None:
     )
 
 
+def _query_charges_with_contract(db: Session):
+    """
+    Charges joined to their contract, with the contract (and its user, role and
+    apartment) loaded from that same join.
+
+    Filters on ContractModel columns reuse the join instead of adding a second
+    one next to the eager load.
+    """
+    return (
+        db.query(ChargeModel)
+        .join(ChargeModel.contract)
+        .options(contains_eager(ChargeModel.contract).joinedload(ContractModel.user).joinedload(UserModel.role))
+        .options(contains_eager(ChargeModel.contract).joinedload(ContractModel.apartment))
+    )
+
+
 def get_all_charges(
     db: Session,
     year: int | None = None,
@@ -27,24 +43,15 @@ def get_all_charges(
     apartment_id: int | None = None,
 ) -> list[ChargeModel]:
     """Get all charges, optionally filtered by year, month, unpaid status, and apartment ID."""
-    query = (
-        db.query(ChargeModel)
-        .options(joinedload(ChargeModel.contract).joinedload(ContractModel.user).joinedload(UserModel.role))
-        .options(joinedload(ChargeModel.contract).joinedload(ContractModel.apartment))
-    )
+    query = _query_charges_with_contract(db)
 
     if apartment_id is not None:
-        query = query.join(ContractModel).filter(
-            ContractModel.apartment_id == apartment_id
-        )
+        query = query.filter(ContractModel.apartment_id == apartment_id)
 
     if year is not None and month is not None:
-        query = query.filter(
-            and_(
-                extract("year", ChargeModel.period) == year,
-                extract("month", ChargeModel.period) == month,
-            )
-        )
+        # period is always the first of the month, so compare it directly
+        # (extract() on the column would bypass ix_charges_period)
+        query = query.filter(ChargeModel.period == date(year, month, 1))
 
     if unpaid is not None:
         if unpaid:
@@ -73,24 +80,17 @@ def get_visible_charges_by_user_id(
     Used for tenant access - tenants can only see charges that are visible and belong to their contracts.
     Optionally filtered by year, month, unpaid status, and apartment ID.
     """
-    query = (
-        db.query(ChargeModel)
-        .options(joinedload(ChargeModel.contract).joinedload(ContractModel.user).joinedload(UserModel.role))
-        .options(joinedload(ChargeModel.contract).joinedload(ContractModel.apartment))
-        .join(ContractModel)
-        .filter(and_(ContractModel.user_id == user_id, ChargeModel.is_visible == True))
+    query = _query_charges_with_contract(db).filter(
+        and_(ContractModel.user_id == user_id, ChargeModel.is_visible == True)
     )
 
     if apartment_id is not None:
         query = query.filter(ContractModel.apartment_id == apartment_id)
 
     if year is not None and month is not None:
-        query = query.filter(
-            and_(
-                extract("year", ChargeModel.period) == year,
-                extract("month", ChargeModel.period) == month,
-            )
-        )
+        # period is always the first of the month, so compare it directly
+        # (extract() on the column would bypass ix_charges_period)
+        query = query.filter(ChargeModel.period == date(year, month, 1))
 
     if unpaid is not None:
         if unpaid:
@@ -101,36 +101,48 @@ def get_visible_charges_by_user_id(
     return query.all()
 
 
-def get_charge_by_contract_and_period(
+def get_contract_with_latest_adjusted_charge(
     db: Session,
     contract_id: int,
-    period: date,
-) -> ChargeModel | None:
-    """Get a charge by contract_id and period. Used to check for duplicates."""
-    return (
-        db.query(ChargeModel)
-        .filter(
-            ChargeModel.contract_id == contract_id,
-            ChargeModel.period == period,
-        )
-        .first()
-    )
+) -> tuple[ContractModel, dict | None] | None:
+    """
+    Get a contract (with user, role and apartment loaded) and its latest charge with is_adjusted=True in one query.
 
+    The latest charge is picked by period descending, then by id descending, through a correlated
+    subquery served by the partial index ix_charges_adjusted_only, and its columns are returned as a
+    plain dict (no ORM instance).
 
-def get_latest_adjusted_charge_by_contract_id(
-    db: Session,
-    contract_id: int,
-) -> ChargeModel | None:
-    """Get the latest charge with is_adjusted=True for a specific contract. Ordered by period descending, then by id descending."""
-    return (
-        db.query(ChargeModel)
-        .filter(
-            ChargeModel.contract_id == contract_id,
-            ChargeModel.is_adjusted == True,
+    Returns None if the contract does not exist, otherwise (contract, charge) where charge is None
+    if the contract has no adjusted charge.
+    """
+    charges = ChargeModel.__table__
+    latest_charge = charges.alias("latest_charge")
+    latest_charge_id = (
+        select(charges.c.id)
+        .where(
+            charges.c.contract_id == ContractModel.id,
+            charges.c.is_adjusted == True,
         )
-        .order_by(ChargeModel.period.desc(), ChargeModel.id.desc())
+        .order_by(charges.c.period.desc(), charges.c.id.desc())
+        .limit(1)
+        .scalar_subquery()
+    )
+    row = (
+        db.query(ContractModel)
+        .options(joinedload(ContractModel.user).joinedload(UserModel.role))
+        .options(joinedload(ContractModel.apartment))
+        .outerjoin(latest_charge, latest_charge.c.id == latest_charge_id)
+        .add_columns(*latest_charge.c)
+        .filter(ContractModel.id == contract_id)
         .first()
     )
+    if row is None:
+        return None
+
+    contract, *charge_values = row
+    if charge_values[0] is None:
+        return contract, None
+    return contract, dict(zip(latest_charge.c.keys(), charge_values))
 
 
 def create_charge(
@@ -207,11 +219,22 @@ def update_charge(
     return charge
 
 
-def delete_charge(db: Session, charge_id: int) -> None:
-    """Delete a charge from the database. Pure data access - no business logic."""
-    charge = get_charge_by_id(db, charge_id)
-    if not charge:
-        raise NotFoundError("Charge not found")
+def charge_exists(db: Session, charge_id: int) -> bool:
+    """Check whether a charge exists without loading it."""
+    return db.query(ChargeModel.id).filter(ChargeModel.id == charge_id).first() is not None
+
 
-    db.delete(charge)
+def delete_unpaid_charge(db: Session, charge_id: int) -> bool:
+    """
+    Delete a charge in a single statement if it has no payment_date. Pure data access - no business logic.
+
+    Returns True if a charge was deleted, False if it does not exist or has been paid.
+    """
+    result = db.execute(
+        delete(ChargeModel).where(
+            ChargeModel.id == charge_id,
+            ChargeModel.payment_date.is_(None),
+        )
+    )
     db.commit()
+    return result.rowcount == 1
@@ -1,5 +1,5 @@
 from datetime import date
-from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from app.schemas.contract import Contract
 
@@ -34,13 +34,6 @@ class ChargeCreate(BaseModel):
     is_visible: bool = Field(default=False, description="Whether this charge is visible to tenants")
     payment_date: date | None = Field(None, description="Payment date (optional)")
 
-    @field_validator("month")
-    @classmethod
-    def validate_month(cls, v: int) -> int:
-        if not (1 <= v <= 12):
-            raise ValueError("Month must be between 1 and 12")
-        return v
-
 
 class ChargeUpdate(BaseModel):
     contract_id: int | None = None
@@ -55,13 +48,6 @@ class ChargeUpdate(BaseModel):
     is_visible: bool | None = None
     payment_date: date | None = Field(None, description="Payment date (can be set to null to clear)")
 
-    @field_validator("month")
-    @classmethod
-    def validate_month(cls, v: int | None) -> int | None:
-        if v is not None and not (1 <= v <= 12):
-            raise ValueError("Month must be between 1 and 12")
-        return v
-
     @model_validator(mode="after")
     def validate_month_year_together(self):
         """Ensure month and year are provided together."""
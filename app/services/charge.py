@@ -1,6 +1,7 @@
 import calendar
 import math
 from datetime import date
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 import httpx
 
@@ -11,11 +12,16 @@ from app.db.models.charge import Charge as ChargeModel
 from app.db.models.contract import Contract as ContractModel
 from app.db.models.user import User
 from app.errors import (
+    CHARGE_NOT_VISIBLE,
+    CHARGE_PERIOD_AFTER_CONTRACT_END,
+    CHARGE_PERIOD_BEFORE_CONTRACT_START,
+    EMAIL_NOT_CONFIGURED,
     DomainValidationError,
     DuplicateResourceError,
     ForbiddenError,
     NotFoundError,
 )
+from app.schemas.charge import Charge as ChargeSchema
 from app.services.email import send_charge_email as send_charge_email_service
 
 
@@ -83,7 +89,7 @@ def get_charge_for_user(
     return charge
 
 
-def _validate_charge_period_in_contract_range(
+def validate_charge_period_in_contract_range(
     period: date, contract: ContractModel
 ) -> None:
     """
@@ -99,16 +105,35 @@ def _validate_charge_period_in_contract_range(
     # Check that period is not before contract start_date
     if period < contract.start_date:
         raise DomainValidationError(
-            f"Charge period {period.strftime('%Y-%m-%d')} is before contract start date {contract.start_date.strftime('%Y-%m-%d')}"
+            f"Charge period {period.strftime('%Y-%m-%d')} is before contract start date {contract.start_date.strftime('%Y-%m-%d')}",
+            code=CHARGE_PERIOD_BEFORE_CONTRACT_START,
         )
 
     # Check that period is not after contract end_date (if end_date exists)
     if contract.end_date is not None and period > contract.end_date:
         raise DomainValidationError(
-            f"Charge period {period.strftime('%Y-%m-%d')} is after contract end date {contract.end_date.strftime('%Y-%m-%d')}"
+            f"Charge period {period.strftime('%Y-%m-%d')} is after contract end date {contract.end_date.strftime('%Y-%m-%d')}",
+            code=CHARGE_PERIOD_AFTER_CONTRACT_END,
         )
 
 
+def _is_duplicate_charge(exc: IntegrityError) -> bool:
+    """Whether exc was raised by the uq_charges_contract_period constraint."""
+    diag = getattr(exc.orig, "diag", None)
+    if diag is not None:
+        # PostgreSQL (psycopg) reports the violated constraint by name
+        return diag.constraint_name == "uq_charges_contract_period"
+    # SQLite only names the columns of the violated unique constraint
+    message = str(exc.orig)
+    return "UNIQUE constraint failed: charges.contract_id, charges.period" in message
+
+
+def _duplicate_charge_error(contract_id: int, period: date) -> DuplicateResourceError:
+    return DuplicateResourceError(
+        f"Charge already exists for contract {contract_id} with period {period.strftime('%Y-%m-%d')}"
+    )
+
+
 def create_charge(
     db: Session,
     contract_id: int,
@@ -129,7 +154,7 @@ def create_charge(
     - Converts month/year to first of month date
     - Validates contract exists
     - Validates charge period is within contract's date range
-    - Validates no duplicate charge for same contract+period
+    - Rejects a duplicate charge for the same contract+period (unique constraint)
     """
     # Convert month/year to first of month date
     period = date(year, month, 1)
@@ -140,31 +165,30 @@ def create_charge(
         raise NotFoundError(f"Contract with id {contract_id} not found")
 
     # Validate charge period is within contract's date range
-    _validate_charge_period_in_contract_range(period, contract)
+    validate_charge_period_in_contract_range(period, contract)
 
-    # Check for duplicate charge (same contract_id and period)
-    existing_charge = charge_repo.get_charge_by_contract_and_period(
-        db, contract_id, period
-    )
-    if existing_charge:
-        raise DuplicateResourceError(
-            f"Charge already exists for contract {contract_id} with period {period.strftime('%Y-%m-%d')}"
+    # Use repository for actual database operation (pure data access).
+    # Duplicates (same contract_id and period) are rejected by the
+    # uq_charges_contract_period constraint instead of a SELECT beforehand.
+    try:
+        return charge_repo.create_charge(
+            db,
+            contract_id=contract_id,
+            period=period,
+            rent=rent,
+            expenses=expenses,
+            municipal_tax=municipal_tax,
+            provincial_tax=provincial_tax,
+            water_bill=water_bill,
+            is_adjusted=is_adjusted,
+            is_visible=is_visible,
+            payment_date=payment_date,
         )
-
-    # Use repository for actual database operation (pure data access)
-    return charge_repo.create_charge(
-        db,
-        contract_id=contract_id,
-        period=period,
-        rent=rent,
-        expenses=expenses,
-        municipal_tax=municipal_tax,
-        provincial_tax=provincial_tax,
-        water_bill=water_bill,
-        is_adjusted=is_adjusted,
-        is_visible=is_visible,
-        payment_date=payment_date,
-    )
+    except IntegrityError as exc:
+        db.rollback()
+        if not _is_duplicate_charge(exc):
+            raise
+        raise _duplicate_charge_error(contract_id, period) from None
 
 
 def update_charge(
@@ -178,7 +202,7 @@ def update_charge(
     - Converts month/year to first of month date if provided
     - Validates contract exists if contract_id provided
     - Validates charge period is within contract's date range (if period or contract_id changes)
-    - Validates no duplicate charge for same contract+period (excluding current charge)
+    - Rejects a duplicate charge for the same contract+period (unique constraint)
 
     Only fields explicitly provided in update_fields will be updated.
     To clear a field (set to None), explicitly include it with None value.
@@ -225,16 +249,7 @@ def update_charge(
 
     # Validate charge period is within contract's date range if period or contract_id is being changed
     if new_period is not None or contract_id is not None:
-        _validate_charge_period_in_contract_range(final_period, final_contract)
-
-        duplicate_charge = charge_repo.get_charge_by_contract_and_period(
-            db, final_contract_id, final_period
-        )
-        # If duplicate exists and it's not the current charge, raise error
-        if duplicate_charge and duplicate_charge.id != charge_id:
-            raise DuplicateResourceError(
-                f"Charge already exists for contract {final_contract_id} with period {final_period.strftime('%Y-%m-%d')}"
-            )
+        validate_charge_period_in_contract_range(final_period, final_contract)
 
     # Build update dict with only fields that were explicitly provided
     # Include period if month/year were provided
@@ -260,8 +275,48 @@ def update_charge(
     if "payment_date" in update_fields:
         update_dict["payment_date"] = payment_date  # Can be None to clear
 
-    # Use repository for actual database operation
-    return charge_repo.update_charge(db, charge_id=charge_id, **update_dict)
+    # Use repository for actual database operation; moving onto another
+    # charge's contract+period violates uq_charges_contract_period
+    try:
+        return charge_repo.update_charge(db, charge_id=charge_id, **update_dict)
+    except IntegrityError as exc:
+        db.rollback()
+        if not _is_duplicate_charge(exc):
+            raise
+        raise _duplicate_charge_error(final_contract_id, final_period) from None
+
+
+def build_charge_email_payload(charge: ChargeModel) -> dict:
+    """
+    Build the keyword arguments for the charge email from a loaded charge.
+
+    Expects charge.contract, charge.contract.user and charge.contract.apartment
+    to be set.
+    """
+    # Format period as "Month Year" (e.g., "January 2025")
+    period_str = f"{calendar.month_name[charge.period.month]} {charge.period.year}"
+
+    # Calculate total
+    total = (
+        charge.rent
+        + charge.expenses
+        + charge.municipal_tax
+        + charge.provincial_tax
+        + charge.water_bill
+    )
+
+    return {
+        "email": charge.contract.user.email,
+        "apartment_floor": charge.contract.apartment.floor,
+        "apartment_letter": charge.contract.apartment.letter,
+        "period": period_str,
+        "rent": charge.rent,
+        "expenses": charge.expenses,
+        "municipal_tax": charge.municipal_tax,
+        "provincial_tax": charge.provincial_tax,
+        "water_bill": charge.water_bill,
+        "total": total,
+    }
 
 
 async def send_charge_email(db: Session, charge_id: int) -> dict[str, str]:
@@ -305,38 +360,16 @@ async def send_charge_email(db: Session, charge_id: int) -> dict[str, str]:
     # Verify charge is visible before sending email
     if not charge.is_visible:
         raise DomainValidationError(
-            "Cannot send email for a charge that is not visible"
+            "Cannot send email for a charge that is not visible",
+            code=CHARGE_NOT_VISIBLE,
         )
 
-    # Format period as "Month Year" (e.g., "January 2025")
-    period_str = f"{calendar.month_name[charge.period.month]} {charge.period.year}"
-
-    # Calculate total
-    total = (
-        charge.rent
-        + charge.expenses
-        + charge.municipal_tax
-        + charge.provincial_tax
-        + charge.water_bill
-    )
-
     # Send email
     try:
-        await send_charge_email_service(
-            email=charge.contract.user.email,
-            apartment_floor=charge.contract.apartment.floor,
-            apartment_letter=charge.contract.apartment.letter,
-            period=period_str,
-            rent=charge.rent,
-            expenses=charge.expenses,
-            municipal_tax=charge.municipal_tax,
-            provincial_tax=charge.provincial_tax,
-            water_bill=charge.water_bill,
-            total=total,
-        )
+        await send_charge_email_service(**build_charge_email_payload(charge))
     except ValueError as e:
         # Convert ValueError from email service to DomainValidationError
-        raise DomainValidationError(str(e))
+        raise DomainValidationError(str(e), code=EMAIL_NOT_CONFIGURED)
 
     return {
         "message": f"Charge email sent successfully to {charge.contract.user.email}"
@@ -346,7 +379,7 @@ async def send_charge_email(db: Session, charge_id: int) -> dict[str, str]:
 def get_latest_adjusted_charge_by_contract_id(
     db: Session,
     contract_id: int,
-) -> ChargeModel:
+) -> ChargeSchema:
     """
     Get the latest charge with is_adjusted=True for a specific contract.
 
@@ -355,6 +388,9 @@ def get_latest_adjusted_charge_by_contract_id(
     - Retrieves the latest adjusted charge for the contract
     - Returns the charge if found
 
+    The contract and its latest adjusted charge are read in a single query,
+    and the charge is built from plain column values rather than an ORM instance.
+
     Args:
         db: Database session
         contract_id: ID of the contract to get the latest adjusted charge for
@@ -366,18 +402,27 @@ def get_latest_adjusted_charge_by_contract_id(
         NotFoundError: If contract not found or no adjusted charge exists for the contract
     """
     # Validate contract exists
-    contract = contract_repo.get_contract_by_id(db, contract_id)
-    if not contract:
+    result = charge_repo.get_contract_with_latest_adjusted_charge(db, contract_id)
+    if result is None:
         raise NotFoundError(f"Contract with id {contract_id} not found")
 
-    # Get the latest adjusted charge
-    charge = charge_repo.get_latest_adjusted_charge_by_contract_id(db, contract_id)
-    if not charge:
+    contract, charge = result
+    return _build_latest_adjusted_charge(contract, charge)
+
+
+def _build_latest_adjusted_charge(
+    contract: ContractModel,
+    charge: dict | None,
+) -> ChargeSchema:
+    """Combine a contract and its latest adjusted charge columns, or raise if there is none."""
+    if charge is None:
         raise NotFoundError(
-            f"No adjusted charge found for contract with id {contract_id}"
+            f"No adjusted charge found for contract with id {contract.id}"
         )
 
-    return charge
+    return ChargeSchema.model_validate(
+        {**charge, "contract": contract}, from_attributes=True
+    )
 
 
 def delete_charge(db: Session, charge_id: int) -> None:
@@ -386,17 +431,19 @@ def delete_charge(db: Session, charge_id: int) -> None:
 
     - Validates charge exists (raises NotFoundError if not)
     - Validates charge is not paid (raises DomainValidationError if payment_date is set)
+
+    The unpaid check is part of the DELETE itself; the charge is only looked up
+    again when nothing was deleted, to tell "not found" from "paid".
     """
-    charge = charge_repo.get_charge_by_id(db, charge_id)
-    if not charge:
-        raise NotFoundError("Charge not found")
+    if charge_repo.delete_unpaid_charge(db, charge_id):
+        return
 
-    if charge.payment_date is not None:
-        raise DomainValidationError(
-            "Cannot delete charge: charge has been paid (payment_date is set)"
-        )
+    if not charge_repo.charge_exists(db, charge_id):
+        raise NotFoundError("Charge not found")
 
-    charge_repo.delete_charge(db, charge_id)
+    raise DomainValidationError(
+        "Cannot delete charge: charge has been paid (payment_date is set)"
+    )
 
 
 async def estimate_adjustment_by_contract_id(
@@ -426,10 +473,11 @@ async def estimate_adjustment_by_contract_id(
         NotFoundError: If contract not found or no adjusted charge exists
         DomainValidationError: If RapidAPI key is not configured, contract doesn't have adjustment_months, or API response is invalid
     """
-    # Validate contract exists
-    contract = contract_repo.get_contract_by_id(db, contract_id)
-    if not contract:
+    # Validate contract exists (its latest adjusted charge comes in the same query)
+    result = charge_repo.get_contract_with_latest_adjusted_charge(db, contract_id)
+    if result is None:
         raise NotFoundError(f"Contract with id {contract_id} not found")
+    contract, latest_charge = result
 
     # Validate RapidAPI key is configured
     if not settings.rapidapi_key:
@@ -444,7 +492,7 @@ async def estimate_adjustment_by_contract_id(
         )
 
     # Get the latest adjusted charge
-    charge = get_latest_adjusted_charge_by_contract_id(db, contract_id)
+    charge = _build_latest_adjusted_charge(contract, latest_charge)
 
     # Prepare the request body for RapidAPI
     request_body = {
@@ -1,105 +1,289 @@
+import logging
 import os
+import shutil
+import sqlite3
 import tempfile
 from pathlib import Path
 
 # Set environment variables BEFORE any imports that might use settings
-# Use a temporary directory for test database to avoid permission issues
-_test_db_dir = tempfile.mkdtemp()
-_test_db_path = os.path.join(_test_db_dir, "test_raffaello.db")
-os.environ["DATABASE_URL"] = f"sqlite:///{_test_db_path}"
+# Tests never go through the app's own engine (get_db is overridden), and every
+# xdist worker keeps its database in memory, so point the app at memory too.
+os.environ["DATABASE_URL"] = "sqlite://"
 os.environ["SECRET_KEY"] = "test-secret-key-min-32-characters-long-for-testing"
 os.environ["ALGORITHM"] = "HS256"
 os.environ["ACCESS_TOKEN_EXPIRE_MINUTES"] = "30"
 os.environ["FIRST_ADMIN_EMAIL"] = "admin@test.example.com"
 os.environ["FIRST_ADMIN_PASSWORD"] = "AdminTest123!"
+# Minimum bcrypt cost: every seeded user, login and password change hashes
+os.environ["PASSWORD_HASH_ROUNDS"] = "4"
 
 import pytest
+import pytest_asyncio
+import resend
 from alembic import command
 from alembic.config import Config
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine, event
-from sqlalchemy.orm import sessionmaker, Session
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.orm import Session
 
 from app.db.base import Base
 from app.main import app
 from app.core.security import create_access_token
+from app.db.models.charge import Charge as ChargeModel
 from app.db.models.user import User as UserModel
 from app.db.models.role import Role as RoleModel
 
+# Keep SQL statement and access logging out of the hot path of every request
+logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
+logging.getLogger("alembic").setLevel(logging.WARNING)
+logging.getLogger("uvicorn.access").disabled = True
+
+# Environment variable through which xdist workers find the migrated template
+TEMPLATE_DB_ENV = "RAFFAELLO_TEST_TEMPLATE_DB"
+
+
+def _run_migrations(db_url: str) -> None:
+    """Run Alembic migrations to set up the database schema and seed data."""
+    alembic_cfg = Config("alembic.ini")
+    alembic_cfg.set_main_option("sqlalchemy.url", db_url)
+    # Logging is configured above; don't let env.py re-run fileConfig
+    alembic_cfg.attributes["configure_logger"] = False
+    try:
+        command.upgrade(alembic_cfg, "head")
+    except Exception as e:
+        print(f"Migration failed: {e}")
+        raise
+
+
+# Users every test can rely on, created once in the template database so that
+# bcrypt hashing and the INSERTs happen once per run instead of once per test.
+SEEDED_USERS = {
+    "tenant": {
+        "email": "tenant@example.com",
+        "name": "Test Tenant",
+        "password": "TenantPass123!",
+    },
+    "accountant": {
+        "email": "accountant@example.com",
+        "name": "Test Accountant",
+        "password": "AccountantPass123!",
+    },
+}
+
+
+def _seed_users(db_url: str) -> None:
+    """Create the SEEDED_USERS in an already migrated database.
+
+    The first admin inserted by migration 002 is re-hashed too, so that every
+    seeded password uses the PASSWORD_HASH_ROUNDS cost set above.
+    """
+    from app.core.config import settings
+    from app.core.security import get_password_hash
+
+    seed_engine = create_engine(db_url)
+    try:
+        with Session(bind=seed_engine) as db:
+            admin = (
+                db.query(UserModel)
+                .filter(UserModel.email == settings.first_admin_email)
+                .one()
+            )
+            admin.password_hash = get_password_hash(settings.first_admin_password)
+            for role_name, seed in SEEDED_USERS.items():
+                role = db.query(RoleModel).filter(RoleModel.name == role_name).first()
+                if not role:
+                    raise RuntimeError(f"{role_name.capitalize()} role not found")
+                db.add(
+                    UserModel(
+                        email=seed["email"],
+                        name=seed["name"],
+                        password_hash=get_password_hash(seed["password"]),
+                        role_id=role.id,
+                    )
+                )
+            db.commit()
+    finally:
+        seed_engine.dispose()
+
+
+def pytest_configure(config):
+    """Migrate a template database once, before any xdist worker starts.
+
+    Workers inherit the controller's environment, so they only copy the file
+    instead of each running every migration again.
+    """
+    if hasattr(config, "workerinput"):
+        return
+    template_dir = tempfile.mkdtemp(prefix="raffaello_template_")
+    template_path = os.path.join(template_dir, "template.db")
+    _run_migrations(f"sqlite:///{template_path}")
+    _seed_users(f"sqlite:///{template_path}")
+    os.environ[TEMPLATE_DB_ENV] = template_path
+
+
+def pytest_unconfigure(config):
+    if hasattr(config, "workerinput"):
+        return
+    template_path = os.environ.pop(TEMPLATE_DB_ENV, None)
+    if template_path:
+        shutil.rmtree(os.path.dirname(template_path), ignore_errors=True)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def email_outbox():
+    """Capture outgoing emails in memory so no test ever reaches Resend."""
+    outbox = []
+
+    def fake_send(params):
+        outbox.append(params)
+        return {"id": f"test-email-{len(outbox)}"}
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(resend.Emails, "send", staticmethod(fake_send))
+        yield outbox
+
 
 @pytest.fixture(scope="function")
-def db_session():
-    """Create a fresh database for each test and run migrations."""
-    # Use a temporary file for SQLite database
-    temp_db_dir = tempfile.mkdtemp()
-    test_db_path = os.path.join(temp_db_dir, "test.db")
-    test_db_url = f"sqlite:///{test_db_path}"
-
-    # Create test engine and session with proper SQLite settings
+def sent_emails(email_outbox):
+    """Emails captured during the current test."""
+    email_outbox.clear()
+    return email_outbox
+
+
+@pytest.fixture(scope="session")
+def engine():
+    """Load the migrated template into an in-memory database for this worker."""
+    memory_conn = sqlite3.connect(":memory:", check_same_thread=False)
+    template_conn = sqlite3.connect(os.environ[TEMPLATE_DB_ENV])
+    try:
+        template_conn.backup(memory_conn)
+    finally:
+        template_conn.close()
+
+    # A single shared connection keeps the in-memory database alive and visible
+    # to every session for the lifetime of the worker.
     test_engine = create_engine(
-        test_db_url,
-        connect_args={"check_same_thread": False},
-        poolclass=None,  # Don't use connection pooling for SQLite
+        "sqlite://",
+        echo=False,
+        creator=lambda: memory_conn,
+        poolclass=StaticPool,
     )
 
-    # Enable WAL mode to reduce locking issues
+    # pysqlite's own transaction handling ignores SAVEPOINTs; let SQLAlchemy
+    # emit BEGIN itself so the per-test rollback below really undoes commits.
     @event.listens_for(test_engine, "connect")
     def set_sqlite_pragma(dbapi_conn, connection_record):
-        cursor = dbapi_conn.cursor()
-        cursor.execute("PRAGMA journal_mode=WAL")
-        cursor.close()
+        dbapi_conn.isolation_level = None
+
+    @event.listens_for(test_engine, "begin")
+    def do_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    yield test_engine
 
-    TestingSessionLocal = sessionmaker(
-        autocommit=False, autoflush=False, bind=test_engine
+    test_engine.dispose()
+    memory_conn.close()
+
+
+def _transactional_session(connection, expire_on_commit: bool = True) -> Session:
+    """Session whose commits only release a SAVEPOINT on ``connection``.
+
+    Configured like ``SessionLocal`` by default, since the per-test session is
+    the one get_db hands to the app.
+    """
+    return Session(
+        bind=connection,
+        autoflush=False,
+        expire_on_commit=expire_on_commit,
+        join_transaction_mode="create_savepoint",
     )
 
-    # Run Alembic migrations to set up the database schema and seed data
-    alembic_cfg = Config("alembic.ini")
-    alembic_cfg.set_main_option("sqlalchemy.url", test_db_url)
+
+@pytest.fixture(scope="module")
+def db_connection(engine):
+    """One connection per test module, inside a transaction rolled back at the end."""
+    connection = engine.connect()
+    transaction = connection.begin()
     try:
-        command.upgrade(alembic_cfg, "head")
-    except Exception as e:
-        print(f"Migration failed: {e}")
-        raise
+        yield connection
+    finally:
+        transaction.rollback()
+        connection.close()
+
 
-    db = TestingSessionLocal()
+@pytest.fixture(scope="module")
+def module_db(db_connection):
+    """Session for module-scoped fixtures; their rows live until the module ends.
+
+    Objects stay loaded after commit, so module fixtures can be read from any
+    test without reloading them.
+    """
+    db = _transactional_session(db_connection, expire_on_commit=False)
     try:
         yield db
     finally:
         db.close()
-        # Dispose the engine to close all connections
-        test_engine.dispose()
-        
-        # Clean up - remove test database file and directory
-        try:
-            if os.path.exists(test_db_path):
-                os.remove(test_db_path)
-            # Also remove WAL files
-            for suffix in ["-wal", "-shm"]:
-                wal_path = f"{test_db_path}{suffix}"
-                if os.path.exists(wal_path):
-                    os.remove(wal_path)
-            if os.path.exists(temp_db_dir):
-                os.rmdir(temp_db_dir)
-        except Exception as e:
-            print(f"Cleanup failed: {e}")
 
 
 @pytest.fixture(scope="function")
-def client(db_session):
-    """Create a test client with database dependency override."""
+def db_session(db_connection):
+    """Run each test inside a SAVEPOINT that is rolled back afterwards.
+
+    Commits made by the code under test only release a nested SAVEPOINT, so
+    every test starts from the migrated data plus its module's fixtures.
+    """
+    savepoint = db_connection.begin_nested()
+    db = _transactional_session(db_connection)
+    try:
+        yield db
+    finally:
+        db.close()
+        savepoint.rollback()
 
-    def override_get_db():
-        try:
-            yield db_session
-        finally:
-            pass
 
+@pytest.fixture(scope="session")
+def session_client():
+    """One TestClient for the whole session, so the app starts up only once."""
+    with TestClient(app) as c:
+        yield c
+
+
+def _override_get_db(request) -> None:
+    """Point get_db at this test's transactional session.
+
+    The session is only set up when a request actually reaches get_db, so
+    tests rejected before that (e.g. missing token) never open a transaction.
+    """
     from app.api.deps import get_db
 
+    def override_get_db():
+        yield request.getfixturevalue("db_session")
+
     app.dependency_overrides[get_db] = override_get_db
 
-    yield TestClient(app)
+
+@pytest.fixture(scope="function")
+def client(session_client, request):
+    """Shared test client with database dependency override for this test."""
+    _override_get_db(request)
+
+    yield session_client
+
+    app.dependency_overrides.clear()
+    session_client.cookies.clear()
+
+
+@pytest_asyncio.fixture(scope="function")
+async def async_client(request):
+    """Create an async client that calls the ASGI app in-process."""
+    _override_get_db(request)
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as ac:
+        yield ac
 
     app.dependency_overrides.clear()
 
@@ -111,110 +295,103 @@ def db(db_session):
 
 
 @pytest.fixture(scope="function")
-def admin_user(db: Session) -> dict:
-    """Create an admin user for testing."""
-    # The admin user is already created by the migration (002_create_users_table.py)
-    # Get it from the database
+def seed_charges(db: Session):
+    """Insert charge_row() rows in one statement, bypassing the API; returns their ids."""
+
+    def _seed(*rows: dict) -> list[int]:
+        result = db.execute(
+            insert(ChargeModel).returning(ChargeModel.id, sort_by_parameter_order=True),
+            list(rows),
+        )
+        ids = list(result.scalars())
+        db.commit()
+        return ids
+
+    return _seed
+
+
+def _user_dict(email: str, password: str) -> dict:
+    """Load a seeded user and return the fields tests rely on.
+
+    Reads the template file rather than the worker's in-memory copy, whose
+    single connection may already be inside a module's transaction.
+    """
     from app.repositories.user import get_user_by_email
+
+    template_engine = create_engine(f"sqlite:///{os.environ[TEMPLATE_DB_ENV]}")
+    try:
+        with Session(bind=template_engine) as db:
+            user = get_user_by_email(db, email)
+            if not user:
+                raise RuntimeError(f"Seeded user {email} not found.")
+            return {
+                "id": user.id,
+                "email": user.email,
+                "name": user.name,
+                "password": password,
+                "role_id": user.role_id,
+            }
+    finally:
+        template_engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def admin_user() -> dict:
+    """Admin user created by the migration (002_create_users_table.py)."""
     from app.core.config import settings
-    
-    user = get_user_by_email(db, settings.first_admin_email)
-    if not user:
-        raise RuntimeError("Admin user not found. Check migration 002.")
-    
-    return {
-        "id": user.id,
-        "email": user.email,
-        "name": user.name,
-        "password": settings.first_admin_password,  # Plaintext password from env
-        "role_id": user.role_id,
-    }
 
+    # Plaintext password from env
+    return _user_dict(settings.first_admin_email, settings.first_admin_password)
 
-@pytest.fixture(scope="function")
+
+@pytest.fixture(scope="session")
 def admin_token(admin_user: dict) -> str:
     """Get JWT token for admin user."""
     token = create_access_token(data={"sub": admin_user["id"]})
     return token
 
 
-@pytest.fixture(scope="function")
-def tenant_user_dict(db: Session) -> dict:
-    """Create a tenant user for testing."""
-    from app.core.security import get_password_hash
-    
-    email = "tenant@example.com"
-    name = "Test Tenant"
-    password = "TenantPass123!"
-    
-    # Get tenant role
-    tenant_role = db.query(RoleModel).filter(RoleModel.name == "tenant").first()
-    if not tenant_role:
-        raise RuntimeError("Tenant role not found")
-    
-    # Create user
-    user = UserModel(
-        email=email,
-        name=name,
-        password_hash=get_password_hash(password),
-        role_id=tenant_role.id,
-    )
-    db.add(user)
-    db.commit()
-    db.refresh(user)
-    
-    return {
-        "id": user.id,
-        "email": user.email,
-        "name": name,
-        "password": password,
-        "role_id": user.role_id,
-    }
+@pytest.fixture(scope="session")
+def admin_headers(admin_token: str) -> dict:
+    """Authorization headers for the admin user."""
+    return {"Authorization": f"Bearer {admin_token}"}
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
+def tenant_user_dict() -> dict:
+    """Tenant user seeded into the template database."""
+    seed = SEEDED_USERS["tenant"]
+    return _user_dict(seed["email"], seed["password"])
+
+
+@pytest.fixture(scope="session")
 def tenant_token(tenant_user_dict: dict) -> str:
     """Get JWT token for tenant user."""
     token = create_access_token(data={"sub": tenant_user_dict["id"]})
     return token
 
 
-@pytest.fixture(scope="function")
-def accountant_user_dict(db: Session) -> dict:
-    """Create an accountant user for testing."""
-    from app.core.security import get_password_hash
+@pytest.fixture(scope="session")
+def tenant_headers(tenant_token: str) -> dict:
+    """Authorization headers for the tenant user."""
+    return {"Authorization": f"Bearer {tenant_token}"}
 
-    email = "accountant@example.com"
-    name = "Test Accountant"
-    password = "AccountantPass123!"
-
-    # Get accountant role
-    accountant_role = db.query(RoleModel).filter(RoleModel.name == "accountant").first()
-    if not accountant_role:
-        raise RuntimeError("Accountant role not found")
-
-    # Create user
-    user = UserModel(
-        email=email,
-        name=name,
-        password_hash=get_password_hash(password),
-        role_id=accountant_role.id,
-    )
-    db.add(user)
-    db.commit()
-    db.refresh(user)
 
-    return {
-        "id": user.id,
-        "email": user.email,
-        "name": name,
-        "password": password,
-        "role_id": user.role_id,
-    }
+@pytest.fixture(scope="session")
+def accountant_user_dict() -> dict:
+    """Accountant user seeded into the template database."""
+    seed = SEEDED_USERS["accountant"]
+    return _user_dict(seed["email"], seed["password"])
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def accountant_token(accountant_user_dict: dict) -> str:
     """Get JWT token for accountant user."""
     token = create_access_token(data={"sub": accountant_user_dict["id"]})
     return token
+
+
+@pytest.fixture(scope="session")
+def accountant_headers(accountant_token: str) -> dict:
+    """Authorization headers for the accountant user."""
+    return {"Authorization": f"Bearer {accountant_token}"}
@@ -0,0 +1,25 @@
+from datetime import date
+from types import MappingProxyType
+
+# Amounts shared by every charge the tests create; read-only so no test can
+# change them for the others
+BASE_CHARGE = MappingProxyType(
+    {
+        "rent": 1000,
+        "expenses": 200,
+        "municipal_tax": 50,
+        "provincial_tax": 30,
+        "water_bill": 40,
+        "is_adjusted": False,
+    }
+)
+
+
+def charge_row(contract_id: int, month: int = 1, year: int = 2025, **extra) -> dict:
+    """Build a charges table row on top of BASE_CHARGE, for seed_charges()."""
+    return {
+        **BASE_CHARGE,
+        "contract_id": contract_id,
+        "period": date(year, month, 1),
+        **extra,
+    }
@@ -1,9 +1,12 @@
+from datetime import date
+
 import pytest
 from sqlalchemy.orm import Session
 
+from app.db.models.apartment import Apartment as ApartmentModel
+from app.db.models.contract import Contract as ContractModel
 from app.db.models.user import User as UserModel
-from app.db.models.role import Role as RoleModel
-from app.core.security import get_password_hash, create_access_token
+from app.core.security import get_password_hash
 
 
 # ============================================================================
@@ -11,67 +14,23 @@ from app.core.security import get_password_hash, create_access_token
 # ============================================================================
 
 
-@pytest.fixture(scope="function")
-def accountant_user_dict(db: Session) -> dict:
-    """Create an accountant user for testing."""
-    email = "accountant@example.com"
-    name = "Test Accountant"
-    password = "AccountantPass123!"
-    
-    # Get accountant role
-    accountant_role = db.query(RoleModel).filter(RoleModel.name == "accountant").first()
-    if not accountant_role:
-        raise RuntimeError("Accountant role not found")
-    
-    # Create user
-    user = UserModel(
-        email=email,
-        name=name,
-        password_hash=get_password_hash(password),
-        role_id=accountant_role.id,
-    )
-    db.add(user)
-    db.commit()
-    db.refresh(user)
-    
-    return {
-        "id": user.id,
-        "email": user.email,
-        "name": name,
-        "password": password,
-        "role_id": user.role_id,
-    }
-
-
-@pytest.fixture(scope="function")
-def accountant_token(accountant_user_dict: dict) -> str:
-    """Get JWT token for accountant user."""
-    token = create_access_token(data={"sub": accountant_user_dict["id"]})
-    return token
-
-
-@pytest.fixture(scope="function")
-def another_tenant_user_dict(db: Session) -> dict:
-    """Create another tenant user for testing."""
+@pytest.fixture(scope="module")
+def another_tenant_user_dict(module_db: Session, tenant_user_dict: dict) -> dict:
+    """Create another tenant user shared by every test in this module."""
     email = "tenant2@example.com"
     name = "Test Tenant 2"
     password = "Tenant2Pass123!"
     
-    # Get tenant role
-    tenant_role = db.query(RoleModel).filter(RoleModel.name == "tenant").first()
-    if not tenant_role:
-        raise RuntimeError("Tenant role not found")
-    
     # Create user
     user = UserModel(
         email=email,
         name=name,
         password_hash=get_password_hash(password),
-        role_id=tenant_role.id,
+        # Same role as the seeded tenant, so no roles lookup is needed
+        role_id=tenant_user_dict["role_id"],
     )
-    db.add(user)
-    db.commit()
-    db.refresh(user)
+    module_db.add(user)
+    module_db.commit()
     
     return {
         "id": user.id,
@@ -87,7 +46,7 @@ def another_tenant_user_dict(db: Session) -> dict:
 # ============================================================================
 
 
-def test_create_apartment_as_admin_success(client, db: Session, admin_token: str):
+def test_create_apartment_as_admin_success(client, admin_headers: dict):
     """Test successful apartment creation by admin."""
     response = client.post(
         "/api/v1/apartments",
@@ -100,7 +59,7 @@ def test_create_apartment_as_admin_success(client, db: Session, admin_token: str
             "epec_contract": 11111,
             "water": 22222,
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 201
     data = response.json()
@@ -114,7 +73,7 @@ def test_create_apartment_as_admin_success(client, db: Session, admin_token: str
     assert "id" in data
 
 
-def test_create_apartment_minimal_fields(client, db: Session, admin_token: str):
+def test_create_apartment_minimal_fields(client, admin_headers: dict):
     """Test apartment creation with only required fields."""
     response = client.post(
         "/api/v1/apartments",
@@ -123,7 +82,7 @@ def test_create_apartment_minimal_fields(client, db: Session, admin_token: str):
             "letter": "B",
             "is_mine": False,
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 201
     data = response.json()
@@ -136,7 +95,7 @@ def test_create_apartment_minimal_fields(client, db: Session, admin_token: str):
     assert data["water"] is None
 
 
-def test_create_apartment_without_authentication(client, db: Session):
+def test_create_apartment_without_authentication(client):
     """Test apartment creation without authentication fails."""
     response = client.post(
         "/api/v1/apartments",
@@ -149,7 +108,7 @@ def test_create_apartment_without_authentication(client, db: Session):
     assert response.status_code == 401
 
 
-def test_create_apartment_as_non_admin(client, db: Session, tenant_token: str):
+def test_create_apartment_as_non_admin(client, tenant_headers: dict):
     """Test apartment creation by non-admin fails."""
     response = client.post(
         "/api/v1/apartments",
@@ -158,13 +117,12 @@ def test_create_apartment_as_non_admin(client, db: Session, tenant_token: str):
             "letter": "A",
             "is_mine": True,
         },
-        headers={"Authorization": f"Bearer {tenant_token}"},
+        headers=tenant_headers,
     )
     assert response.status_code == 403
-    assert "Not enough permissions" in response.json()["detail"]
 
 
-def test_create_apartment_as_accountant_fails(client, db: Session, accountant_token: str):
+def test_create_apartment_as_accountant_fails(client, accountant_headers: dict):
     """Test apartment creation by accountant fails (only admin can create)."""
     response = client.post(
         "/api/v1/apartments",
@@ -173,13 +131,12 @@ def test_create_apartment_as_accountant_fails(client, db: Session, accountant_to
             "letter": "A",
             "is_mine": True,
         },
-        headers={"Authorization": f"Bearer {accountant_token}"},
+        headers=accountant_headers,
     )
     assert response.status_code == 403
-    assert "Not enough permissions" in response.json()["detail"]
 
 
-def test_create_apartment_invalid_letter_too_long(client, db: Session, admin_token: str):
+def test_create_apartment_invalid_letter_too_long(client, admin_headers: dict):
     """Test apartment creation with letter longer than 1 character fails."""
     response = client.post(
         "/api/v1/apartments",
@@ -188,13 +145,13 @@ def test_create_apartment_invalid_letter_too_long(client, db: Session, admin_tok
             "letter": "AB",  # Too long
             "is_mine": True,
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     # Pydantic validates max_length at request parsing level (422)
     assert response.status_code == 422
 
 
-def test_create_apartment_invalid_letter_empty(client, db: Session, admin_token: str):
+def test_create_apartment_invalid_letter_empty(client, admin_headers: dict):
     """Test apartment creation with empty letter fails."""
     response = client.post(
         "/api/v1/apartments",
@@ -203,13 +160,13 @@ def test_create_apartment_invalid_letter_empty(client, db: Session, admin_token:
             "letter": "",  # Empty string
             "is_mine": True,
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     # Pydantic validates min_length at request parsing level (422)
     assert response.status_code == 422
 
 
-def test_create_apartment_missing_required_fields(client, db: Session, admin_token: str):
+def test_create_apartment_missing_required_fields(client, admin_headers: dict):
     """Test apartment creation with missing required fields fails."""
     response = client.post(
         "/api/v1/apartments",
@@ -217,13 +174,13 @@ def test_create_apartment_missing_required_fields(client, db: Session, admin_tok
             "floor": 1,
             # Missing letter and is_mine
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     # Pydantic validates required fields at request parsing level (422)
     assert response.status_code == 422
 
 
-def test_create_apartment_duplicate_floor_letter(client, db: Session, admin_token: str):
+def test_create_apartment_duplicate_floor_letter(client, db: Session, admin_headers: dict):
     """Test apartment creation with duplicate floor and letter fails."""
     from app.repositories.apartment import create_apartment
     
@@ -238,7 +195,7 @@ def test_create_apartment_duplicate_floor_letter(client, db: Session, admin_toke
             "letter": "A",
             "is_mine": False,
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 409  # Conflict
     data = response.json()
@@ -246,7 +203,7 @@ def test_create_apartment_duplicate_floor_letter(client, db: Session, admin_toke
     assert data["code"] == "DUPLICATE_RESOURCE"
 
 
-def test_create_apartment_same_floor_different_letter(client, db: Session, admin_token: str):
+def test_create_apartment_same_floor_different_letter(client, db: Session, admin_headers: dict):
     """Test that apartments with same floor but different letter can be created."""
     from app.repositories.apartment import create_apartment
     
@@ -261,7 +218,7 @@ def test_create_apartment_same_floor_different_letter(client, db: Session, admin
             "letter": "B",
             "is_mine": False,
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 201
     data = response.json()
@@ -269,7 +226,7 @@ def test_create_apartment_same_floor_different_letter(client, db: Session, admin
     assert data["letter"] == "B"
 
 
-def test_create_apartment_same_letter_different_floor(client, db: Session, admin_token: str):
+def test_create_apartment_same_letter_different_floor(client, db: Session, admin_headers: dict):
     """Test that apartments with same letter but different floor can be created."""
     from app.repositories.apartment import create_apartment
     
@@ -284,7 +241,7 @@ def test_create_apartment_same_letter_different_floor(client, db: Session, admin
             "letter": "A",
             "is_mine": False,
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 201
     data = response.json()
@@ -297,7 +254,7 @@ def test_create_apartment_same_letter_different_floor(client, db: Session, admin
 # ============================================================================
 
 
-def test_get_all_apartments_as_admin(client, db: Session, admin_token: str):
+def test_get_all_apartments_as_admin(client, db: Session, admin_headers: dict):
     """Test admin can get all apartments."""
     # Create some apartments first
     from app.repositories.apartment import create_apartment
@@ -307,7 +264,7 @@ def test_get_all_apartments_as_admin(client, db: Session, admin_token: str):
     
     response = client.get(
         "/api/v1/apartments",
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 200
     data = response.json()
@@ -317,7 +274,7 @@ def test_get_all_apartments_as_admin(client, db: Session, admin_token: str):
     assert all("letter" in apt for apt in data)
 
 
-def test_get_all_apartments_as_accountant(client, db: Session, accountant_token: str):
+def test_get_all_apartments_as_accountant(client, db: Session, accountant_headers: dict):
     """Test accountant can get all apartments."""
     # Create some apartments first
     from app.repositories.apartment import create_apartment
@@ -327,25 +284,25 @@ def test_get_all_apartments_as_accountant(client, db: Session, accountant_token:
     
     response = client.get(
         "/api/v1/apartments",
-        headers={"Authorization": f"Bearer {accountant_token}"},
+        headers=accountant_headers,
     )
     assert response.status_code == 200
     data = response.json()
     assert len(data) == 2
 
 
-def test_get_all_apartments_empty_list(client, db: Session, admin_token: str):
+def test_get_all_apartments_empty_list(client, admin_headers: dict):
     """Test getting all apartments when none exist returns empty list."""
     response = client.get(
         "/api/v1/apartments",
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 200
     data = response.json()
     assert data == []
 
 
-def test_get_all_apartments_as_tenant_with_open_contract(client, db: Session, tenant_token: str, tenant_user_dict: dict):
+def test_get_all_apartments_as_tenant_with_open_contract(client, db: Session, tenant_headers: dict, tenant_user_dict: dict):
     """Test tenant can get apartments with open contracts (end_date is None)."""
     from app.repositories.apartment import create_apartment
     from app.services.contract import create_contract
@@ -364,7 +321,7 @@ def test_get_all_apartments_as_tenant_with_open_contract(client, db: Session, te
     
     response = client.get(
         "/api/v1/apartments",
-        headers={"Authorization": f"Bearer {tenant_token}"},
+        headers=tenant_headers,
     )
     assert response.status_code == 200
     data = response.json()
@@ -374,7 +331,7 @@ def test_get_all_apartments_as_tenant_with_open_contract(client, db: Session, te
     assert data[0]["letter"] == "A"
 
 
-def test_get_all_apartments_as_tenant_with_future_end_date(client, db: Session, tenant_token: str, tenant_user_dict: dict):
+def test_get_all_apartments_as_tenant_with_future_end_date(client, db: Session, tenant_headers: dict, tenant_user_dict: dict):
     """Test tenant can get apartments with open contracts (end_date in the future)."""
     from datetime import date, timedelta
     from app.repositories.apartment import create_apartment
@@ -397,7 +354,7 @@ def test_get_all_apartments_as_tenant_with_future_end_date(client, db: Session,
     
     response = client.get(
         "/api/v1/apartments",
-        headers={"Authorization": f"Bearer {tenant_token}"},
+        headers=tenant_headers,
     )
     assert response.status_code == 200
     data = response.json()
@@ -407,7 +364,7 @@ def test_get_all_apartments_as_tenant_with_future_end_date(client, db: Session,
     assert data[0]["letter"] == "B"
 
 
-def test_get_all_apartments_as_tenant_with_end_date_today(client, db: Session, tenant_token: str, tenant_user_dict: dict):
+def test_get_all_apartments_as_tenant_with_end_date_today(client, db: Session, tenant_headers: dict, tenant_user_dict: dict):
     """Test tenant can get apartments with contracts ending today (end_date == today is considered open)."""
     from datetime import date
     from app.repositories.apartment import create_apartment
@@ -430,7 +387,7 @@ def test_get_all_apartments_as_tenant_with_end_date_today(client, db: Session, t
     
     response = client.get(
         "/api/v1/apartments",
-        headers={"Authorization": f"Bearer {tenant_token}"},
+        headers=tenant_headers,
     )
     assert response.status_code == 200
     data = response.json()
@@ -440,7 +397,7 @@ def test_get_all_apartments_as_tenant_with_end_date_today(client, db: Session, t
     assert data[0]["letter"] == "E"
 
 
-def test_get_all_apartments_as_tenant_excludes_closed_contracts(client, db: Session, tenant_token: str, tenant_user_dict: dict):
+def test_get_all_apartments_as_tenant_excludes_closed_contracts(client, db: Session, tenant_headers: dict, tenant_user_dict: dict):
     """Test tenant cannot see apartments with closed contracts (end_date in the past)."""
     from datetime import date
     from app.repositories.apartment import create_apartment
@@ -471,14 +428,14 @@ def test_get_all_apartments_as_tenant_excludes_closed_contracts(client, db: Sess
     
     response = client.get(
         "/api/v1/apartments",
-        headers={"Authorization": f"Bearer {tenant_token}"},
+        headers=tenant_headers,
     )
     assert response.status_code == 200
     data = response.json()
     assert len(data) == 0  # Should not see apartment with closed contract
 
 
-def test_get_all_apartments_as_tenant_excludes_future_contracts(client, db: Session, tenant_token: str, tenant_user_dict: dict):
+def test_get_all_apartments_as_tenant_excludes_future_contracts(client, db: Session, tenant_headers: dict, tenant_user_dict: dict):
     """Test tenant cannot see apartments with contracts that haven't started yet (start_date in the future)."""
     from datetime import date
     from app.repositories.apartment import create_apartment
@@ -505,14 +462,14 @@ def test_get_all_apartments_as_tenant_excludes_future_contracts(client, db: Sess
     
     response = client.get(
         "/api/v1/apartments",
-        headers={"Authorization": f"Bearer {tenant_token}"},
+        headers=tenant_headers,
     )
     assert response.status_code == 200
     data = response.json()
     assert len(data) == 0  # Should not see apartment with future contract
 
 
-def test_get_all_apartments_as_tenant_excludes_future_contracts_with_end_date(client, db: Session, tenant_token: str, tenant_user_dict: dict):
+def test_get_all_apartments_as_tenant_excludes_future_contracts_with_end_date(client, db: Session, tenant_headers: dict, tenant_user_dict: dict):
     """Test tenant cannot see apartments with future contracts even if end_date is in the future."""
     from datetime import date
     from app.repositories.apartment import create_apartment
@@ -544,14 +501,14 @@ def test_get_all_apartments_as_tenant_excludes_future_contracts_with_end_date(cl
     
     response = client.get(
         "/api/v1/apartments",
-        headers={"Authorization": f"Bearer {tenant_token}"},
+        headers=tenant_headers,
     )
     assert response.status_code == 200
     data = response.json()
     assert len(data) == 0  # Should not see apartment with future contract
 
 
-def test_get_all_apartments_as_tenant_includes_contract_starting_today(client, db: Session, tenant_token: str, tenant_user_dict: dict):
+def test_get_all_apartments_as_tenant_includes_contract_starting_today(client, db: Session, tenant_headers: dict, tenant_user_dict: dict):
     """Test tenant can see apartments with contracts starting today (if today is first of month) or this month."""
     from datetime import date
     from app.repositories.apartment import create_apartment
@@ -573,7 +530,7 @@ def test_get_all_apartments_as_tenant_includes_contract_starting_today(client, d
     
     response = client.get(
         "/api/v1/apartments",
-        headers={"Authorization": f"Bearer {tenant_token}"},
+        headers=tenant_headers,
     )
     assert response.status_code == 200
     data = response.json()
@@ -583,7 +540,7 @@ def test_get_all_apartments_as_tenant_includes_contract_starting_today(client, d
     assert data[0]["letter"] == "H"
 
 
-def test_get_all_apartments_as_tenant_includes_contract_started_in_past(client, db: Session, tenant_token: str, tenant_user_dict: dict):
+def test_get_all_apartments_as_tenant_includes_contract_started_in_past(client, db: Session, tenant_headers: dict, tenant_user_dict: dict):
     """Test tenant can see apartments with contracts that started in the past."""
     from datetime import date
     from app.repositories.apartment import create_apartment
@@ -609,7 +566,7 @@ def test_get_all_apartments_as_tenant_includes_contract_started_in_past(client,
     
     response = client.get(
         "/api/v1/apartments",
-        headers={"Authorization": f"Bearer {tenant_token}"},
+        headers=tenant_headers,
     )
     assert response.status_code == 200
     data = response.json()
@@ -619,7 +576,7 @@ def test_get_all_apartments_as_tenant_includes_contract_started_in_past(client,
     assert data[0]["letter"] == "I"
 
 
-def test_get_all_apartments_as_tenant_excludes_no_contracts(client, db: Session, tenant_token: str):
+def test_get_all_apartments_as_tenant_excludes_no_contracts(client, db: Session, tenant_headers: dict):
     """Test tenant cannot see apartments without contracts."""
     from app.repositories.apartment import create_apartment
     
@@ -628,44 +585,37 @@ def test_get_all_apartments_as_tenant_excludes_no_contracts(client, db: Session,
     
     response = client.get(
         "/api/v1/apartments",
-        headers={"Authorization": f"Bearer {tenant_token}"},
+        headers=tenant_headers,
     )
     assert response.status_code == 200
     data = response.json()
     assert len(data) == 0  # Should not see apartment without contract
 
 
-def test_get_all_apartments_as_tenant_only_own_apartments(client, db: Session, tenant_token: str, tenant_user_dict: dict, another_tenant_user_dict: dict):
+def test_get_all_apartments_as_tenant_only_own_apartments(client, db: Session, tenant_headers: dict, tenant_user_dict: dict, another_tenant_user_dict: dict):
     """Test tenant only sees their own apartments, not other tenants' apartments."""
-    from app.repositories.apartment import create_apartment
-    from app.services.contract import create_contract
-    
-    # Create two apartments
-    apartment1 = create_apartment(db, floor=1, letter="A", is_mine=True)
-    apartment2 = create_apartment(db, floor=2, letter="B", is_mine=False)
-    
-    # Create open contract for tenant_user_dict with apartment1
-    create_contract(
-        db,
-        user_id=tenant_user_dict["id"],
-        apartment_id=apartment1.id,
-        start_month=1,
-        start_year=2025,
-    )
-    
-    # Create open contract for another_tenant_user_dict with apartment2
-    create_contract(
-        db,
-        user_id=another_tenant_user_dict["id"],
-        apartment_id=apartment2.id,
-        start_month=1,
-        start_year=2025,
-    )
+    # Two apartments, each with an open contract for a different tenant,
+    # inserted in a single transaction
+    apartment1 = ApartmentModel(floor=1, letter="A", is_mine=True)
+    apartment2 = ApartmentModel(floor=2, letter="B", is_mine=False)
+    db.add_all([
+        ContractModel(
+            user_id=tenant_user_dict["id"],
+            apartment=apartment1,
+            start_date=date(2025, 1, 1),
+        ),
+        ContractModel(
+            user_id=another_tenant_user_dict["id"],
+            apartment=apartment2,
+            start_date=date(2025, 1, 1),
+        ),
+    ])
+    db.commit()
     
     # Tenant should only see apartment1 (their own)
     response = client.get(
         "/api/v1/apartments",
-        headers={"Authorization": f"Bearer {tenant_token}"},
+        headers=tenant_headers,
     )
     assert response.status_code == 200
     data = response.json()
@@ -675,53 +625,36 @@ def test_get_all_apartments_as_tenant_only_own_apartments(client, db: Session, t
     assert data[0]["letter"] == "A"
 
 
-def test_get_all_apartments_as_tenant_empty_list_no_contracts(client, db: Session, tenant_token: str):
+def test_get_all_apartments_as_tenant_empty_list_no_contracts(client, tenant_headers: dict):
     """Test tenant sees empty list when they have no open contracts."""
     response = client.get(
         "/api/v1/apartments",
-        headers={"Authorization": f"Bearer {tenant_token}"},
+        headers=tenant_headers,
     )
     assert response.status_code == 200
     data = response.json()
     assert data == []
 
 
-def test_get_all_apartments_as_tenant_multiple_open_contracts(client, db: Session, tenant_token: str, tenant_user_dict: dict):
+def test_get_all_apartments_as_tenant_multiple_open_contracts(client, db: Session, tenant_headers: dict, tenant_user_dict: dict):
     """Test tenant can see multiple apartments with open contracts."""
-    from app.repositories.apartment import create_apartment
-    from app.services.contract import create_contract
-    
-    # Create multiple apartments
-    apartment1 = create_apartment(db, floor=1, letter="A", is_mine=True)
-    apartment2 = create_apartment(db, floor=2, letter="B", is_mine=False)
-    apartment3 = create_apartment(db, floor=3, letter="C", is_mine=True)
-    
-    # Create open contracts for all three apartments
-    create_contract(
-        db,
-        user_id=tenant_user_dict["id"],
-        apartment_id=apartment1.id,
-        start_month=1,
-        start_year=2025,
-    )
-    create_contract(
-        db,
-        user_id=tenant_user_dict["id"],
-        apartment_id=apartment2.id,
-        start_month=2,
-        start_year=2025,
-    )
-    create_contract(
-        db,
-        user_id=tenant_user_dict["id"],
-        apartment_id=apartment3.id,
-        start_month=3,
-        start_year=2025,
-    )
+    # Three apartments with an open contract each, inserted in a single transaction
+    apartment1 = ApartmentModel(floor=1, letter="A", is_mine=True)
+    apartment2 = ApartmentModel(floor=2, letter="B", is_mine=False)
+    apartment3 = ApartmentModel(floor=3, letter="C", is_mine=True)
+    db.add_all([
+        ContractModel(
+            user_id=tenant_user_dict["id"],
+            apartment=apartment,
+            start_date=date(2025, month, 1),
+        )
+        for month, apartment in enumerate((apartment1, apartment2, apartment3), start=1)
+    ])
+    db.commit()
     
     response = client.get(
         "/api/v1/apartments",
-        headers={"Authorization": f"Bearer {tenant_token}"},
+        headers=tenant_headers,
     )
     assert response.status_code == 200
     data = response.json()
@@ -732,7 +665,7 @@ def test_get_all_apartments_as_tenant_multiple_open_contracts(client, db: Sessio
     assert apartment3.id in apartment_ids
 
 
-def test_get_all_apartments_without_authentication(client, db: Session):
+def test_get_all_apartments_without_authentication(client):
     """Test getting all apartments without authentication fails."""
     response = client.get("/api/v1/apartments")
     assert response.status_code == 401
@@ -743,7 +676,7 @@ def test_get_all_apartments_without_authentication(client, db: Session):
 # ============================================================================
 
 
-def test_get_apartment_by_id_as_admin(client, db: Session, admin_token: str):
+def test_get_apartment_by_id_as_admin(client, db: Session, admin_headers: dict):
     """Test admin can get apartment by ID."""
     from app.repositories.apartment import create_apartment
     
@@ -751,7 +684,7 @@ def test_get_apartment_by_id_as_admin(client, db: Session, admin_token: str):
     
     response = client.get(
         f"/api/v1/apartments/{apartment.id}",
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 200
     data = response.json()
@@ -762,7 +695,7 @@ def test_get_apartment_by_id_as_admin(client, db: Session, admin_token: str):
     assert data["ecogas"] == 12345
 
 
-def test_get_apartment_by_id_as_accountant(client, db: Session, accountant_token: str):
+def test_get_apartment_by_id_as_accountant(client, db: Session, accountant_headers: dict):
     """Test accountant can get apartment by ID."""
     from app.repositories.apartment import create_apartment
     
@@ -770,7 +703,7 @@ def test_get_apartment_by_id_as_accountant(client, db: Session, accountant_token
     
     response = client.get(
         f"/api/v1/apartments/{apartment.id}",
-        headers={"Authorization": f"Bearer {accountant_token}"},
+        headers=accountant_headers,
     )
     assert response.status_code == 200
     data = response.json()
@@ -779,11 +712,11 @@ def test_get_apartment_by_id_as_accountant(client, db: Session, accountant_token
     assert data["letter"] == "D"
 
 
-def test_get_apartment_by_id_not_found(client, db: Session, admin_token: str):
+def test_get_apartment_by_id_not_found(client, admin_headers: dict):
     """Test getting non-existent apartment returns 404."""
     response = client.get(
         "/api/v1/apartments/999",
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 404
     data = response.json()
@@ -791,7 +724,7 @@ def test_get_apartment_by_id_not_found(client, db: Session, admin_token: str):
     assert data["code"] == "NOT_FOUND"
 
 
-def test_get_apartment_by_id_as_tenant_fails(client, db: Session, tenant_token: str):
+def test_get_apartment_by_id_as_tenant_fails(client, db: Session, tenant_headers: dict):
     """Test tenant cannot get apartment by ID."""
     from app.repositories.apartment import create_apartment
     
@@ -799,13 +732,12 @@ def test_get_apartment_by_id_as_tenant_fails(client, db: Session, tenant_token:
     
     response = client.get(
         f"/api/v1/apartments/{apartment.id}",
-        headers={"Authorization": f"Bearer {tenant_token}"},
+        headers=tenant_headers,
     )
     assert response.status_code == 403
-    assert "Not enough permissions" in response.json()["detail"]
 
 
-def test_get_apartment_by_id_without_authentication(client, db: Session):
+def test_get_apartment_by_id_without_authentication(client):
     """Test getting apartment by ID without authentication fails."""
     response = client.get("/api/v1/apartments/1")
     assert response.status_code == 401
@@ -816,7 +748,7 @@ def test_get_apartment_by_id_without_authentication(client, db: Session):
 # ============================================================================
 
 
-def test_update_apartment_as_admin_success(client, db: Session, admin_token: str):
+def test_update_apartment_as_admin_success(client, db: Session, admin_headers: dict):
     """Test successful apartment update by admin."""
     from app.repositories.apartment import create_apartment
     
@@ -831,7 +763,7 @@ def test_update_apartment_as_admin_success(client, db: Session, admin_token: str
             "ecogas": 99999,
             "water": 88888,
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 200
     data = response.json()
@@ -843,7 +775,7 @@ def test_update_apartment_as_admin_success(client, db: Session, admin_token: str
     assert data["water"] == 88888
 
 
-def test_update_apartment_partial_update(client, db: Session, admin_token: str):
+def test_update_apartment_partial_update(client, db: Session, admin_headers: dict):
     """Test partial apartment update (only some fields)."""
     from app.repositories.apartment import create_apartment
     
@@ -857,7 +789,7 @@ def test_update_apartment_partial_update(client, db: Session, admin_token: str):
             "floor": 5,
             "ecogas": 33333,
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 200
     data = response.json()
@@ -868,14 +800,14 @@ def test_update_apartment_partial_update(client, db: Session, admin_token: str):
     assert data["water"] == 22222  # Unchanged
 
 
-def test_update_apartment_not_found(client, db: Session, admin_token: str):
+def test_update_apartment_not_found(client, admin_headers: dict):
     """Test updating non-existent apartment returns 404."""
     response = client.put(
         "/api/v1/apartments/999",
         json={
             "floor": 1,
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 404
     data = response.json()
@@ -883,7 +815,7 @@ def test_update_apartment_not_found(client, db: Session, admin_token: str):
     assert data["code"] == "NOT_FOUND"
 
 
-def test_update_apartment_as_accountant_fails(client, db: Session, accountant_token: str):
+def test_update_apartment_as_accountant_fails(client, db: Session, accountant_headers: dict):
     """Test accountant cannot update apartments."""
     from app.repositories.apartment import create_apartment
     
@@ -894,13 +826,12 @@ def test_update_apartment_as_accountant_fails(client, db: Session, accountant_to
         json={
             "floor": 2,
         },
-        headers={"Authorization": f"Bearer {accountant_token}"},
+        headers=accountant_headers,
     )
     assert response.status_code == 403
-    assert "Not enough permissions" in response.json()["detail"]
 
 
-def test_update_apartment_as_tenant_fails(client, db: Session, tenant_token: str):
+def test_update_apartment_as_tenant_fails(client, db: Session, tenant_headers: dict):
     """Test tenant cannot update apartments."""
     from app.repositories.apartment import create_apartment
     
@@ -911,13 +842,12 @@ def test_update_apartment_as_tenant_fails(client, db: Session, tenant_token: str
         json={
             "floor": 2,
         },
-        headers={"Authorization": f"Bearer {tenant_token}"},
+        headers=tenant_headers,
     )
     assert response.status_code == 403
-    assert "Not enough permissions" in response.json()["detail"]
 
 
-def test_update_apartment_without_authentication(client, db: Session):
+def test_update_apartment_without_authentication(client):
     """Test updating apartment without authentication fails."""
     response = client.put(
         "/api/v1/apartments/1",
@@ -928,7 +858,7 @@ def test_update_apartment_without_authentication(client, db: Session):
     assert response.status_code == 401
 
 
-def test_update_apartment_duplicate_floor_letter(client, db: Session, admin_token: str):
+def test_update_apartment_duplicate_floor_letter(client, db: Session, admin_headers: dict):
     """Test updating apartment to duplicate floor and letter fails."""
     from app.repositories.apartment import create_apartment
     
@@ -943,7 +873,7 @@ def test_update_apartment_duplicate_floor_letter(client, db: Session, admin_toke
             "floor": 1,
             "letter": "A",
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 409  # Conflict
     data = response.json()
@@ -951,7 +881,7 @@ def test_update_apartment_duplicate_floor_letter(client, db: Session, admin_toke
     assert data["code"] == "DUPLICATE_RESOURCE"
 
 
-def test_update_apartment_duplicate_floor_only(client, db: Session, admin_token: str):
+def test_update_apartment_duplicate_floor_only(client, db: Session, admin_headers: dict):
     """Test updating apartment to duplicate floor (but different letter) succeeds."""
     from app.repositories.apartment import create_apartment
     
@@ -967,7 +897,7 @@ def test_update_apartment_duplicate_floor_only(client, db: Session, admin_token:
             "floor": 1,
             # letter stays "B", so final combination is (1, B) which is different from (1, A)
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 200
     data = response.json()
@@ -975,7 +905,7 @@ def test_update_apartment_duplicate_floor_only(client, db: Session, admin_token:
     assert data["letter"] == "B"
 
 
-def test_update_apartment_duplicate_letter_only(client, db: Session, admin_token: str):
+def test_update_apartment_duplicate_letter_only(client, db: Session, admin_headers: dict):
     """Test updating apartment to duplicate letter (but different floor) succeeds."""
     from app.repositories.apartment import create_apartment
     
@@ -990,7 +920,7 @@ def test_update_apartment_duplicate_letter_only(client, db: Session, admin_token
             "letter": "A",
             # floor stays 2, so final is (2, A) which is different from (1, A)
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     # This should succeed since (2, A) is different from (1, A)
     assert response.status_code == 200
@@ -999,7 +929,7 @@ def test_update_apartment_duplicate_letter_only(client, db: Session, admin_token
     assert data["letter"] == "A"
 
 
-def test_update_apartment_same_floor_letter_no_change(client, db: Session, admin_token: str):
+def test_update_apartment_same_floor_letter_no_change(client, db: Session, admin_headers: dict):
     """Test updating apartment without changing floor and letter succeeds."""
     from app.repositories.apartment import create_apartment
     
@@ -1013,7 +943,7 @@ def test_update_apartment_same_floor_letter_no_change(client, db: Session, admin
             "is_mine": False,
             "ecogas": 12345,
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 200
     data = response.json()
@@ -1023,7 +953,7 @@ def test_update_apartment_same_floor_letter_no_change(client, db: Session, admin
     assert data["ecogas"] == 12345
 
 
-def test_update_apartment_to_same_floor_letter(client, db: Session, admin_token: str):
+def test_update_apartment_to_same_floor_letter(client, db: Session, admin_headers: dict):
     """Test updating apartment to explicitly set same floor and letter it already has succeeds."""
     from app.repositories.apartment import create_apartment
     
@@ -1038,7 +968,7 @@ def test_update_apartment_to_same_floor_letter(client, db: Session, admin_token:
             "letter": "A",
             "is_mine": False,
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 200
     data = response.json()
@@ -1047,7 +977,7 @@ def test_update_apartment_to_same_floor_letter(client, db: Session, admin_token:
     assert data["is_mine"] is False
 
 
-def test_update_apartment_invalid_letter_too_long(client, db: Session, admin_token: str):
+def test_update_apartment_invalid_letter_too_long(client, db: Session, admin_headers: dict):
     """Test apartment update with letter longer than 1 character fails."""
     from app.repositories.apartment import create_apartment
     
@@ -1058,13 +988,13 @@ def test_update_apartment_invalid_letter_too_long(client, db: Session, admin_tok
         json={
             "letter": "AB",  # Too long
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     # Pydantic validates max_length at request parsing level (422)
     assert response.status_code == 422
 
 
-def test_update_apartment_invalid_letter_empty(client, db: Session, admin_token: str):
+def test_update_apartment_invalid_letter_empty(client, db: Session, admin_headers: dict):
     """Test apartment update with empty letter fails."""
     from app.repositories.apartment import create_apartment
     
@@ -1075,7 +1005,7 @@ def test_update_apartment_invalid_letter_empty(client, db: Session, admin_token:
         json={
             "letter": "",  # Empty string
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     # Pydantic validates min_length at request parsing level (422)
     assert response.status_code == 422
@@ -1086,7 +1016,7 @@ def test_update_apartment_invalid_letter_empty(client, db: Session, admin_token:
 # ============================================================================
 
 
-def test_delete_apartment_by_id_as_admin_success(client, db: Session, admin_token: str):
+def test_delete_apartment_by_id_as_admin_success(client, db: Session, admin_headers: dict):
     """Test admin can delete an apartment without contracts."""
     from app.repositories.apartment import create_apartment
     
@@ -1096,28 +1026,28 @@ def test_delete_apartment_by_id_as_admin_success(client, db: Session, admin_toke
     # Verify apartment exists
     response = client.get(
         f"/api/v1/apartments/{apartment.id}",
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 200
     
     # Delete the apartment
     response = client.delete(
         f"/api/v1/apartments/{apartment.id}",
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 204
     
     # Verify apartment is deleted
     response = client.get(
         f"/api/v1/apartments/{apartment.id}",
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 404
     assert "Apartment not found" in response.json()["detail"]
 
 
 def test_delete_apartment_by_id_as_admin_with_contracts_forbidden(
-    client, db: Session, admin_token: str, tenant_user_dict: dict
+    client, db: Session, admin_headers: dict, tenant_user_dict: dict
 ):
     """Test admin cannot delete an apartment with associated contracts."""
     from app.repositories.apartment import create_apartment
@@ -1138,7 +1068,7 @@ def test_delete_apartment_by_id_as_admin_with_contracts_forbidden(
     # Try to delete the apartment
     response = client.delete(
         f"/api/v1/apartments/{apartment.id}",
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 400
     assert "associated contracts" in response.json()["detail"].lower()
@@ -1147,13 +1077,13 @@ def test_delete_apartment_by_id_as_admin_with_contracts_forbidden(
     # Verify apartment still exists
     response = client.get(
         f"/api/v1/apartments/{apartment.id}",
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 200
 
 
 def test_delete_apartment_by_id_as_tenant_forbidden(
-    client, db: Session, tenant_token: str
+    client, db: Session, tenant_headers: dict
 ):
     """Test tenant cannot delete apartments."""
     from app.repositories.apartment import create_apartment
@@ -1162,14 +1092,13 @@ def test_delete_apartment_by_id_as_tenant_forbidden(
     
     response = client.delete(
         f"/api/v1/apartments/{apartment.id}",
-        headers={"Authorization": f"Bearer {tenant_token}"},
+        headers=tenant_headers,
     )
     assert response.status_code == 403
-    assert "Not enough permissions" in response.json()["detail"]
 
 
 def test_delete_apartment_by_id_as_accountant_forbidden(
-    client, db: Session, accountant_token: str
+    client, db: Session, accountant_headers: dict
 ):
     """Test accountant cannot delete apartments."""
     from app.repositories.apartment import create_apartment
@@ -1178,17 +1107,16 @@ def test_delete_apartment_by_id_as_accountant_forbidden(
     
     response = client.delete(
         f"/api/v1/apartments/{apartment.id}",
-        headers={"Authorization": f"Bearer {accountant_token}"},
+        headers=accountant_headers,
     )
     assert response.status_code == 403
-    assert "Not enough permissions" in response.json()["detail"]
 
 
-def test_delete_apartment_by_id_not_found(client, db: Session, admin_token: str):
+def test_delete_apartment_by_id_not_found(client, admin_headers: dict):
     """Test deleting non-existent apartment returns 404."""
     response = client.delete(
         "/api/v1/apartments/99999",
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 404
     assert "Apartment not found" in response.json()["detail"]
@@ -1206,35 +1134,30 @@ def test_delete_apartment_by_id_without_authentication(client, db: Session):
 
 
 def test_delete_apartment_by_id_multiple_contracts_forbidden(
-    client, db: Session, admin_token: str, tenant_user_dict: dict, another_tenant_user_dict: dict
+    client, db: Session, admin_headers: dict, tenant_user_dict: dict, another_tenant_user_dict: dict
 ):
     """Test admin cannot delete an apartment with multiple contracts."""
-    from app.repositories.apartment import create_apartment
-    from app.services.contract import create_contract
-    
-    # Create an apartment
-    apartment = create_apartment(db, floor=1, letter="A", is_mine=True)
-    
-    # Create multiple contracts for the apartment (with different users)
-    create_contract(
-        db,
-        user_id=tenant_user_dict["id"],
-        apartment_id=apartment.id,
-        start_month=1,
-        start_year=2025,
-    )
-    create_contract(
-        db,
-        user_id=another_tenant_user_dict["id"],
-        apartment_id=apartment.id,
-        start_month=2,
-        start_year=2025,
-    )
+    # One apartment with contracts for two different users, inserted in a
+    # single transaction
+    apartment = ApartmentModel(floor=1, letter="A", is_mine=True)
+    db.add_all([
+        ContractModel(
+            user_id=tenant_user_dict["id"],
+            apartment=apartment,
+            start_date=date(2025, 1, 1),
+        ),
+        ContractModel(
+            user_id=another_tenant_user_dict["id"],
+            apartment=apartment,
+            start_date=date(2025, 2, 1),
+        ),
+    ])
+    db.commit()
     
     # Try to delete the apartment
     response = client.delete(
         f"/api/v1/apartments/{apartment.id}",
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 400
     assert "associated contracts" in response.json()["detail"].lower()
@@ -1243,13 +1166,13 @@ def test_delete_apartment_by_id_multiple_contracts_forbidden(
     # Verify apartment still exists
     response = client.get(
         f"/api/v1/apartments/{apartment.id}",
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 200
 
 
 def test_delete_apartment_by_id_with_closed_contract_forbidden(
-    client, db: Session, admin_token: str, tenant_user_dict: dict
+    client, db: Session, admin_headers: dict, tenant_user_dict: dict
 ):
     """Test admin cannot delete an apartment even if contract is closed (end_date in past)."""
     from datetime import date
@@ -1294,7 +1217,7 @@ def test_delete_apartment_by_id_with_closed_contract_forbidden(
     # Try to delete the apartment (should fail even though contract is closed)
     response = client.delete(
         f"/api/v1/apartments/{apartment.id}",
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 400
     assert "associated contracts" in response.json()["detail"].lower()
@@ -1303,6 +1226,6 @@ def test_delete_apartment_by_id_with_closed_contract_forbidden(
     # Verify apartment still exists
     response = client.get(
         f"/api/v1/apartments/{apartment.id}",
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 200
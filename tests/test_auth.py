@@ -1,5 +1,3 @@
-from sqlalchemy.orm import Session
-
 from app.db.models.user import User as UserModel
 from app.db.models.role import Role as RoleModel
 from app.core.security import get_password_hash
@@ -11,7 +9,7 @@ from app.repositories.user import get_user_by_email
 # ============================================================================
 
 
-def test_login_success(client, db: Session, admin_user: dict):
+def test_login_success(client, admin_user: dict):
     """Test successful login returns access token and user info."""
     response = client.post(
         "/api/v1/auth/login",
@@ -27,7 +25,7 @@ def test_login_success(client, db: Session, admin_user: dict):
     assert data["user"]["email"] == admin_user["email"]
 
 
-def test_login_invalid_email(client, db: Session):
+def test_login_invalid_email(client):
     """Test login with non-existent email."""
     response = client.post(
         "/api/v1/auth/login",
@@ -40,7 +38,7 @@ def test_login_invalid_email(client, db: Session):
     assert "Incorrect email or password" in response.json()["detail"]
 
 
-def test_login_wrong_password(client, db: Session, admin_user: dict):
+def test_login_wrong_password(client, admin_user: dict):
     """Test login with wrong password."""
     response = client.post(
         "/api/v1/auth/login",
@@ -58,7 +56,7 @@ def test_login_wrong_password(client, db: Session, admin_user: dict):
 # ============================================================================
 
 
-def test_create_user_as_admin_success(client, db: Session, admin_token: str):
+def test_create_user_as_admin_success(client, admin_headers: dict):
     """Test successful user creation by admin."""
     response = client.post(
         "/api/v1/users",
@@ -67,7 +65,7 @@ def test_create_user_as_admin_success(client, db: Session, admin_token: str):
             "name": "New User",
             "password": "NewPassword123!",
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 201
     data = response.json()
@@ -78,26 +76,26 @@ def test_create_user_as_admin_success(client, db: Session, admin_token: str):
     assert data["role"]["id"] == 2  # tenant role id
 
 
-def test_create_user_with_specific_role(client, db: Session, admin_token: str):
+def test_create_user_with_specific_role(client, admin_headers: dict):
     """Test user creation with specific role_id."""
     response = client.post(
         "/api/v1/users",
         json={
-            "email": "accountant@example.com",
+            "email": "john.accountant@example.com",
             "name": "John Accountant",
             "password": "AccPassword123!",
             "role_id": 3,  # accountant role
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 201
     data = response.json()
-    assert data["email"] == "accountant@example.com"
+    assert data["email"] == "john.accountant@example.com"
     assert data["name"] == "John Accountant"
     assert data["role"]["id"] == 3
 
 
-def test_create_user_without_authentication(client, db: Session):
+def test_create_user_without_authentication(client):
     """Test user creation without authentication fails."""
     response = client.post(
         "/api/v1/users",
@@ -110,9 +108,7 @@ def test_create_user_without_authentication(client, db: Session):
     assert response.status_code == 401  # Missing authentication credentials
 
 
-def test_create_user_as_non_admin(
-    client, db: Session, tenant_user_dict: dict, tenant_token: str
-):
+def test_create_user_as_non_admin(client, tenant_user_dict: dict, tenant_headers: dict):
     """Test user creation by non-admin fails."""
     response = client.post(
         "/api/v1/users",
@@ -121,14 +117,14 @@ def test_create_user_as_non_admin(
             "name": "Another User",
             "password": "AnotherPass123!",
         },
-        headers={"Authorization": f"Bearer {tenant_token}"},
+        headers=tenant_headers,
     )
     assert response.status_code == 403
     assert "Not enough permissions" in response.json()["detail"]
 
 
 def test_create_user_email_already_exists(
-    client, db: Session, admin_token: str, admin_user: dict
+    client, admin_headers: dict, admin_user: dict
 ):
     """Test user creation with duplicate email fails."""
     response = client.post(
@@ -138,13 +134,13 @@ def test_create_user_email_already_exists(
             "name": "Duplicate User",
             "password": "NewPassword123!",
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 409
     assert "Email already registered" in response.json()["detail"]
 
 
-def test_create_user_invalid_password_too_short(client, db: Session, admin_token: str):
+def test_create_user_invalid_password_too_short(client, admin_headers: dict):
     """Test user creation with password too short fails."""
     response = client.post(
         "/api/v1/users",
@@ -153,15 +149,13 @@ def test_create_user_invalid_password_too_short(client, db: Session, admin_token
             "name": "New User",
             "password": "Short1!",  # Only 7 chars, needs 8+
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     # Pydantic validates min_length at request parsing level (422)
     assert response.status_code == 422
 
 
-def test_create_user_invalid_password_no_uppercase(
-    client, db: Session, admin_token: str
-):
+def test_create_user_invalid_password_no_uppercase(client, admin_headers: dict):
     """Test user creation with no uppercase letter fails."""
     response = client.post(
         "/api/v1/users",
@@ -170,15 +164,13 @@ def test_create_user_invalid_password_no_uppercase(
             "name": "New User",
             "password": "password123!",  # No uppercase
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 400
     assert "uppercase" in response.json()["detail"]
 
 
-def test_create_user_invalid_password_no_lowercase(
-    client, db: Session, admin_token: str
-):
+def test_create_user_invalid_password_no_lowercase(client, admin_headers: dict):
     """Test user creation with no lowercase letter fails."""
     response = client.post(
         "/api/v1/users",
@@ -187,13 +179,13 @@ def test_create_user_invalid_password_no_lowercase(
             "name": "New User",
             "password": "PASSWORD123!",  # No lowercase
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 400
     assert "lowercase" in response.json()["detail"]
 
 
-def test_create_user_invalid_password_no_number(client, db: Session, admin_token: str):
+def test_create_user_invalid_password_no_number(client, admin_headers: dict):
     """Test user creation with no number fails."""
     response = client.post(
         "/api/v1/users",
@@ -202,13 +194,13 @@ def test_create_user_invalid_password_no_number(client, db: Session, admin_token
             "name": "New User",
             "password": "Password!",  # No number
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 400
     assert "number" in response.json()["detail"]
 
 
-def test_create_user_invalid_password_no_symbol(client, db: Session, admin_token: str):
+def test_create_user_invalid_password_no_symbol(client, admin_headers: dict):
     """Test user creation with no symbol fails."""
     response = client.post(
         "/api/v1/users",
@@ -217,13 +209,13 @@ def test_create_user_invalid_password_no_symbol(client, db: Session, admin_token
             "name": "New User",
             "password": "Password123",  # No symbol
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 400
     assert "symbol" in response.json()["detail"]
 
 
-def test_create_user_invalid_role_id(client, db: Session, admin_token: str):
+def test_create_user_invalid_role_id(client, admin_headers: dict):
     """Test user creation with invalid role_id fails."""
     response = client.post(
         "/api/v1/users",
@@ -233,7 +225,7 @@ def test_create_user_invalid_role_id(client, db: Session, admin_token: str):
             "password": "NewPassword123!",
             "role_id": 999,  # Non-existent role
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 404
     assert "not found" in response.json()["detail"]
@@ -244,13 +236,11 @@ def test_create_user_invalid_role_id(client, db: Session, admin_token: str):
 # ============================================================================
 
 
-def test_get_current_user_success(
-    client, db: Session, admin_token: str, admin_user: dict
-):
+def test_get_current_user_success(client, admin_headers: dict, admin_user: dict):
     """Test getting current user info with valid token."""
     response = client.get(
         "/api/v1/auth/me",
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 200
     data = response.json()
@@ -258,13 +248,13 @@ def test_get_current_user_success(
     assert data["id"] == admin_user["id"]
 
 
-def test_get_current_user_without_token(client, db: Session):
+def test_get_current_user_without_token(client):
     """Test getting current user without token fails."""
     response = client.get("/api/v1/auth/me")
     assert response.status_code == 401  # Missing authentication credentials
 
 
-def test_get_current_user_invalid_token(client, db: Session):
+def test_get_current_user_invalid_token(client):
     """Test getting current user with invalid token fails."""
     response = client.get(
         "/api/v1/auth/me",
@@ -274,12 +264,52 @@ def test_get_current_user_invalid_token(client, db: Session):
     assert "Could not validate credentials" in response.json()["detail"]
 
 
+def test_get_current_user_token_cache_skips_decode(
+    client, admin_headers: dict, monkeypatch
+):
+    """Test a cached token is not verified again while the cache entry is fresh."""
+    from collections import OrderedDict
+
+    import jwt
+
+    from app.core import security
+    from app.core.config import settings
+
+    monkeypatch.setattr(settings, "token_cache_ttl_seconds", 5)
+    monkeypatch.setattr(security, "_token_cache", OrderedDict())
+    decodes = []
+    real_decode = jwt.decode
+
+    def counting_decode(*args, **kwargs):
+        decodes.append(args[0])
+        return real_decode(*args, **kwargs)
+
+    monkeypatch.setattr(security.jwt, "decode", counting_decode)
+
+    for _ in range(3):
+        response = client.get(
+            "/api/v1/auth/me",
+            headers=admin_headers,
+        )
+        assert response.status_code == 200
+    assert len(decodes) == 1
+
+    # Invalid tokens are verified (and rejected) every time
+    for _ in range(2):
+        response = client.get(
+            "/api/v1/auth/me",
+            headers={"Authorization": "Bearer invalid_token"},
+        )
+        assert response.status_code == 401
+    assert len(decodes) == 3
+
+
 # ============================================================================
 # PASSWORD RESET TESTS
 # ============================================================================
 
 
-def test_forgot_password_success(client, db: Session, admin_user: dict):
+def test_forgot_password_success(client, admin_user: dict):
     """Test password reset request returns generic success even when SMTP not configured."""
     response = client.post(
         "/api/v1/auth/forgot-password",
@@ -291,7 +321,26 @@ def test_forgot_password_success(client, db: Session, admin_user: dict):
     assert "If the email exists" in response.json()["message"]
 
 
-def test_forgot_password_nonexistent_email(client, db: Session):
+def test_forgot_password_sends_email_when_configured(
+    client, admin_user: dict, sent_emails: list, monkeypatch
+):
+    """Test password reset email is handed to Resend when it is configured."""
+    from app.core.config import settings
+
+    monkeypatch.setattr(settings, "resend_api_key", "test-resend-key")
+    monkeypatch.setattr(settings, "resend_from_email", "noreply@test.example.com")
+
+    response = client.post(
+        "/api/v1/auth/forgot-password",
+        json={"email": admin_user["email"]},
+    )
+    assert response.status_code == 200
+    assert len(sent_emails) == 1
+    assert sent_emails[0]["to"] == admin_user["email"]
+    assert sent_emails[0]["subject"] == "Password Reset Request"
+
+
+def test_forgot_password_nonexistent_email(client):
     """Test password reset for non-existent email (should not reveal if user exists)."""
     response = client.post(
         "/api/v1/auth/forgot-password",
@@ -302,7 +351,7 @@ def test_forgot_password_nonexistent_email(client, db: Session):
     assert "If the email exists" in response.json()["message"]
 
 
-def test_reset_password_invalid_token(client, db: Session):
+def test_reset_password_invalid_token(client):
     """Test password reset with invalid token fails."""
     response = client.post(
         "/api/v1/auth/reset-password",
@@ -0,0 +1,229 @@
+from datetime import date
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.db.models.apartment import Apartment as ApartmentModel
+from app.db.models.charge import Charge as ChargeModel
+from app.db.models.contract import Contract as ContractModel
+from app.db.models.user import User as UserModel
+from app.errors import (
+    CHARGE_PERIOD_AFTER_CONTRACT_END,
+    CHARGE_PERIOD_BEFORE_CONTRACT_START,
+    DomainValidationError,
+)
+from app.repositories.apartment import create_apartment
+from app.repositories.charge import (
+    get_contract_with_latest_adjusted_charge,
+    get_visible_charges_by_user_id,
+)
+from app.services.charge import (
+    build_charge_email_payload,
+    create_charge,
+    validate_charge_period_in_contract_range,
+)
+from app.services.contract import create_contract
+from tests.factories import BASE_CHARGE, charge_row
+
+
+def _loaded_charge(month: int = 1, year: int = 2025, **amounts) -> ChargeModel:
+    """Build an unsaved charge with the relationships the email payload reads."""
+    contract = ContractModel(
+        user=UserModel(email="tenant@example.com"),
+        apartment=ApartmentModel(floor=1, letter="A"),
+    )
+    return ChargeModel(
+        contract=contract,
+        period=date(year, month, 1),
+        **{**BASE_CHARGE, **amounts},
+    )
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+
+@pytest.fixture(scope="module")
+def apartment(module_db: Session):
+    """Create an apartment shared by every test in this module."""
+    return create_apartment(module_db, floor=1, letter="A", is_mine=True)
+
+
+@pytest.fixture(scope="module")
+def contract(module_db: Session, tenant_user_dict: dict, apartment):
+    """Create a contract shared by every test in this module."""
+    return create_contract(
+        module_db,
+        user_id=tenant_user_dict["id"],
+        apartment_id=apartment.id,
+        start_month=1,
+        start_year=2025,
+    )
+
+
+# ============================================================================
+# CREATE CHARGE TESTS
+# ============================================================================
+
+
+def test_create_charge_other_integrity_error_is_not_duplicate(db: Session, contract):
+    """Test integrity errors other than the contract+period constraint are re-raised."""
+    with pytest.raises(IntegrityError):
+        create_charge(
+            db,
+            contract_id=contract.id,
+            month=2,
+            year=2025,
+            rent=None,  # NOT NULL violation, not a duplicate
+            expenses=200,
+            municipal_tax=50,
+            provincial_tax=30,
+            water_bill=40,
+            is_adjusted=False,
+        )
+
+    # The failed insert was rolled back and the session is still usable
+    assert db.query(ChargeModel).filter_by(contract_id=contract.id).count() == 0
+
+
+# ============================================================================
+# LIST CHARGES TESTS
+# ============================================================================
+
+
+def test_list_visible_charges_loads_contract_in_one_query(
+    db: Session, seed_charges, tenant_user_dict: dict, contract, apartment
+):
+    """Test the tenant list query joins contracts once and loads everything it returns."""
+    seed_charges(
+        charge_row(contract.id, month=1, year=2025, is_visible=True),
+        charge_row(contract.id, month=2, year=2025, is_visible=True),
+    )
+    connection = db.connection()
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(connection, "before_cursor_execute", capture)
+    try:
+        charges = get_visible_charges_by_user_id(
+            db, tenant_user_dict["id"], apartment_id=apartment.id
+        )
+        # Reading the relationships the response serializes must not query
+        for charge in charges:
+            assert charge.contract.user.role.name == "tenant"
+            assert charge.contract.apartment.id == apartment.id
+    finally:
+        event.remove(connection, "before_cursor_execute", capture)
+
+    assert len(charges) == 2
+    assert len(statements) == 1
+    assert statements[0].count("JOIN contracts") == 1
+
+
+# ============================================================================
+# GET LATEST ADJUSTED CHARGE TESTS
+# ============================================================================
+
+
+def test_latest_adjusted_charge_query_uses_index_without_sort(db: Session, contract):
+    """Test the latest adjusted lookup is an index search with no sort step."""
+    connection = db.connection()
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(connection, "before_cursor_execute", capture)
+    try:
+        get_contract_with_latest_adjusted_charge(db, contract.id)
+    finally:
+        event.remove(connection, "before_cursor_execute", capture)
+
+    statement, parameters = statements[-1]
+    plan = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+    details = " ".join(row[-1] for row in plan)
+    assert "ix_charges_adjusted_only" in details
+    assert "TEMP B-TREE" not in details
+
+
+# ============================================================================
+# CHARGE EMAIL PAYLOAD TESTS
+# ============================================================================
+
+
+def test_build_charge_email_payload_calculates_total_correctly():
+    """Test that total is calculated correctly from all charge components."""
+    charge = _loaded_charge(
+        month=3,
+        rent=1500,
+        expenses=300,
+        municipal_tax=75,
+        provincial_tax=45,
+        water_bill=60,
+    )
+
+    payload = build_charge_email_payload(charge)
+    assert payload["total"] == 1500 + 300 + 75 + 45 + 60  # 1980
+    assert payload["period"] == "March 2025"
+
+
+@pytest.mark.parametrize(
+    "month,expected_period",
+    [
+        (1, "January 2025"),
+        (6, "June 2025"),
+        (12, "December 2025"),
+    ],
+)
+def test_build_charge_email_payload_formats_period_correctly(
+    month: int, expected_period: str
+):
+    """Test that period is formatted correctly as 'Month Year'."""
+    payload = build_charge_email_payload(_loaded_charge(month=month))
+    assert payload["period"] == expected_period
+
+
+# ============================================================================
+# CHARGE PERIOD VALIDATION TESTS (Contract Date Range)
+# ============================================================================
+
+
+@pytest.mark.parametrize(
+    "period,end_date",
+    [
+        (date(2025, 1, 1), None),  # on contract start date
+        (date(2030, 1, 1), None),  # open-ended contract
+        (date(2025, 3, 1), date(2025, 6, 30)),  # within range
+        (date(2025, 6, 1), date(2025, 6, 30)),  # on contract end month
+    ],
+)
+def test_validate_charge_period_in_contract_range_accepts(
+    period: date, end_date: date | None
+):
+    """Test periods inside the contract range pass validation."""
+    contract = ContractModel(start_date=date(2025, 1, 1), end_date=end_date)
+
+    validate_charge_period_in_contract_range(period, contract)
+
+
+@pytest.mark.parametrize(
+    "period,expected_code",
+    [
+        (date(2024, 12, 1), CHARGE_PERIOD_BEFORE_CONTRACT_START),
+        (date(2025, 7, 1), CHARGE_PERIOD_AFTER_CONTRACT_END),
+    ],
+)
+def test_validate_charge_period_in_contract_range_rejects(
+    period: date, expected_code: str
+):
+    """Test periods outside the contract range raise a validation error."""
+    contract = ContractModel(start_date=date(2025, 1, 1), end_date=date(2025, 6, 30))
+
+    with pytest.raises(DomainValidationError) as exc_info:
+        validate_charge_period_in_contract_range(period, contract)
+    assert exc_info.value.code == expected_code
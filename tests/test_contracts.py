@@ -2,9 +2,14 @@ import pytest
 from datetime import date
 from sqlalchemy.orm import Session
 
+from app.db.models.apartment import Apartment as ApartmentModel
+from app.db.models.contract import Contract as ContractModel
 from app.db.models.user import User as UserModel
-from app.db.models.role import Role as RoleModel
 from app.core.security import get_password_hash, create_access_token
+from app.repositories.apartment import create_apartment
+from app.services.charge import create_charge
+from app.services.contract import create_contract
+from tests.factories import BASE_CHARGE
 
 
 # ============================================================================
@@ -12,74 +17,29 @@ from app.core.security import get_password_hash, create_access_token
 # ============================================================================
 
 
-@pytest.fixture(scope="function")
-def accountant_user_dict(db: Session) -> dict:
-    """Create an accountant user for testing."""
-    email = "accountant@example.com"
-    name = "Test Accountant"
-    password = "AccountantPass123!"
-    
-    # Get accountant role
-    accountant_role = db.query(RoleModel).filter(RoleModel.name == "accountant").first()
-    if not accountant_role:
-        raise RuntimeError("Accountant role not found")
-    
-    # Create user
-    user = UserModel(
-        email=email,
-        name=name,
-        password_hash=get_password_hash(password),
-        role_id=accountant_role.id,
-    )
-    db.add(user)
-    db.commit()
-    db.refresh(user)
-    
-    return {
-        "id": user.id,
-        "email": user.email,
-        "name": name,
-        "password": password,
-        "role_id": user.role_id,
-    }
-
-
-@pytest.fixture(scope="function")
-def accountant_token(accountant_user_dict: dict) -> str:
-    """Get JWT token for accountant user."""
-    token = create_access_token(data={"sub": accountant_user_dict["id"]})
-    return token
-
+@pytest.fixture(scope="module")
+def apartment(module_db: Session):
+    """Create an apartment shared by every test in this module."""
+    return create_apartment(module_db, floor=1, letter="A", is_mine=True)
 
-@pytest.fixture(scope="function")
-def apartment(db: Session):
-    """Create an apartment for testing."""
-    from app.repositories.apartment import create_apartment
-    return create_apartment(db, floor=1, letter="A", is_mine=True)
 
-
-@pytest.fixture(scope="function")
-def another_tenant_user_dict(db: Session) -> dict:
-    """Create another tenant user for testing."""
+@pytest.fixture(scope="module")
+def another_tenant_user_dict(module_db: Session, tenant_user_dict: dict) -> dict:
+    """Create another tenant user shared by every test in this module."""
     email = "tenant2@example.com"
     name = "Test Tenant 2"
     password = "Tenant2Pass123!"
     
-    # Get tenant role
-    tenant_role = db.query(RoleModel).filter(RoleModel.name == "tenant").first()
-    if not tenant_role:
-        raise RuntimeError("Tenant role not found")
-    
     # Create user
     user = UserModel(
         email=email,
         name=name,
         password_hash=get_password_hash(password),
-        role_id=tenant_role.id,
+        # Same role as the seeded tenant, so no roles lookup is needed
+        role_id=tenant_user_dict["role_id"],
     )
-    db.add(user)
-    db.commit()
-    db.refresh(user)
+    module_db.add(user)
+    module_db.commit()
     
     return {
         "id": user.id,
@@ -91,6 +51,18 @@ def another_tenant_user_dict(db: Session) -> dict:
 
 
 @pytest.fixture(scope="function")
+def seed_contracts(db: Session):
+    """Insert Contract objects with one add_all + commit, bypassing the service."""
+
+    def _seed(*contracts: ContractModel) -> list[ContractModel]:
+        db.add_all(contracts)
+        db.commit()
+        return list(contracts)
+
+    return _seed
+
+
+@pytest.fixture(scope="module")
 def another_tenant_token(another_tenant_user_dict: dict) -> str:
     """Get JWT token for another tenant user."""
     token = create_access_token(data={"sub": another_tenant_user_dict["id"]})
@@ -102,7 +74,7 @@ def another_tenant_token(another_tenant_user_dict: dict) -> str:
 # ============================================================================
 
 
-def test_create_contract_as_admin_success(client, db: Session, admin_token: str, tenant_user_dict: dict, apartment):
+def test_create_contract_as_admin_success(client, admin_headers: dict, tenant_user_dict: dict, apartment):
     """Test successful contract creation by admin."""
     response = client.post(
         "/api/v1/contracts",
@@ -115,7 +87,7 @@ def test_create_contract_as_admin_success(client, db: Session, admin_token: str,
             "end_year": 2025,
             "adjustment_months": 3,
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 201
     data = response.json()
@@ -127,7 +99,7 @@ def test_create_contract_as_admin_success(client, db: Session, admin_token: str,
     assert "id" in data
 
 
-def test_create_contract_minimal_fields(client, db: Session, admin_token: str, tenant_user_dict: dict, apartment):
+def test_create_contract_minimal_fields(client, admin_headers: dict, tenant_user_dict: dict, apartment):
     """Test contract creation with only required fields."""
     response = client.post(
         "/api/v1/contracts",
@@ -137,7 +109,7 @@ def test_create_contract_minimal_fields(client, db: Session, admin_token: str, t
             "start_month": 6,
             "start_year": 2025,
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 201
     data = response.json()
@@ -146,7 +118,7 @@ def test_create_contract_minimal_fields(client, db: Session, admin_token: str, t
     assert data["adjustment_months"] is None
 
 
-def test_create_contract_without_authentication(client, db: Session, tenant_user_dict: dict, apartment):
+def test_create_contract_without_authentication(client, tenant_user_dict: dict, apartment):
     """Test contract creation without authentication fails."""
     response = client.post(
         "/api/v1/contracts",
@@ -160,7 +132,7 @@ def test_create_contract_without_authentication(client, db: Session, tenant_user
     assert response.status_code == 401
 
 
-def test_create_contract_as_tenant_fails(client, db: Session, tenant_token: str, tenant_user_dict: dict, apartment):
+def test_create_contract_as_tenant_fails(client, tenant_headers: dict, tenant_user_dict: dict, apartment):
     """Test contract creation by tenant fails."""
     response = client.post(
         "/api/v1/contracts",
@@ -170,13 +142,12 @@ def test_create_contract_as_tenant_fails(client, db: Session, tenant_token: str,
             "start_month": 1,
             "start_year": 2025,
         },
-        headers={"Authorization": f"Bearer {tenant_token}"},
+        headers=tenant_headers,
     )
     assert response.status_code == 403
-    assert "Not enough permissions" in response.json()["detail"]
 
 
-def test_create_contract_as_accountant_fails(client, db: Session, accountant_token: str, tenant_user_dict: dict, apartment):
+def test_create_contract_as_accountant_fails(client, accountant_headers: dict, tenant_user_dict: dict, apartment):
     """Test contract creation by accountant fails."""
     response = client.post(
         "/api/v1/contracts",
@@ -186,73 +157,40 @@ def test_create_contract_as_accountant_fails(client, db: Session, accountant_tok
             "start_month": 1,
             "start_year": 2025,
         },
-        headers={"Authorization": f"Bearer {accountant_token}"},
+        headers=accountant_headers,
     )
     assert response.status_code == 403
-    assert "Not enough permissions" in response.json()["detail"]
-
-
-def test_create_contract_invalid_month_zero(client, db: Session, admin_token: str, tenant_user_dict: dict, apartment):
-    """Test contract creation with start_month=0 fails."""
-    response = client.post(
-        "/api/v1/contracts",
-        json={
-            "user_id": tenant_user_dict["id"],
-            "apartment_id": apartment.id,
-            "start_month": 0,
-            "start_year": 2025,
-        },
-        headers={"Authorization": f"Bearer {admin_token}"},
-    )
-    assert response.status_code == 422
-
-
-def test_create_contract_invalid_month_negative(client, db: Session, admin_token: str, tenant_user_dict: dict, apartment):
-    """Test contract creation with negative month fails."""
-    response = client.post(
-        "/api/v1/contracts",
-        json={
-            "user_id": tenant_user_dict["id"],
-            "apartment_id": apartment.id,
-            "start_month": -1,
-            "start_year": 2025,
-        },
-        headers={"Authorization": f"Bearer {admin_token}"},
-    )
-    assert response.status_code == 422
-
-
-def test_create_contract_invalid_month_too_large(client, db: Session, admin_token: str, tenant_user_dict: dict, apartment):
-    """Test contract creation with start_month=13 fails."""
-    response = client.post(
-        "/api/v1/contracts",
-        json={
-            "user_id": tenant_user_dict["id"],
-            "apartment_id": apartment.id,
-            "start_month": 13,
-            "start_year": 2025,
-        },
-        headers={"Authorization": f"Bearer {admin_token}"},
-    )
-    assert response.status_code == 422
 
 
-def test_create_contract_invalid_month_100(client, db: Session, admin_token: str, tenant_user_dict: dict, apartment):
-    """Test contract creation with month=100 fails."""
+@pytest.mark.parametrize(
+    "field,value",
+    [
+        ("start_month", 0),
+        ("start_month", -1),
+        ("start_month", 13),
+        ("start_month", 100),
+        ("adjustment_months", 0),
+        ("adjustment_months", -5),
+    ],
+)
+def test_create_contract_invalid_field_fails(client, admin_headers: dict, tenant_user_dict: dict, apartment, field: str, value: int):
+    """Test contract creation with an out-of-range month or adjustment period fails."""
+    payload = {
+        "user_id": tenant_user_dict["id"],
+        "apartment_id": apartment.id,
+        "start_month": 1,
+        "start_year": 2025,
+    }
+    payload[field] = value
     response = client.post(
         "/api/v1/contracts",
-        json={
-            "user_id": tenant_user_dict["id"],
-            "apartment_id": apartment.id,
-            "start_month": 100,
-            "start_year": 2025,
-        },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        json=payload,
+        headers=admin_headers,
     )
     assert response.status_code == 422
 
 
-def test_create_contract_missing_required_fields(client, db: Session, admin_token: str):
+def test_create_contract_missing_required_fields(client, admin_headers: dict):
     """Test contract creation with missing required fields fails."""
     response = client.post(
         "/api/v1/contracts",
@@ -261,12 +199,12 @@ def test_create_contract_missing_required_fields(client, db: Session, admin_toke
             "start_year": 2025,
             # Missing user_id and apartment_id
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 422
 
 
-def test_create_contract_user_not_found(client, db: Session, admin_token: str, apartment):
+def test_create_contract_user_not_found(client, admin_headers: dict, apartment):
     """Test contract creation with non-existent user fails."""
     response = client.post(
         "/api/v1/contracts",
@@ -276,13 +214,13 @@ def test_create_contract_user_not_found(client, db: Session, admin_token: str, a
             "start_month": 1,
             "start_year": 2025,
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 404
     assert "not found" in response.json()["detail"].lower()
 
 
-def test_create_contract_user_not_tenant(client, db: Session, admin_token: str, accountant_user_dict: dict, apartment):
+def test_create_contract_user_not_tenant(client, admin_headers: dict, accountant_user_dict: dict, apartment):
     """Test contract creation with non-tenant user fails."""
     response = client.post(
         "/api/v1/contracts",
@@ -292,13 +230,13 @@ def test_create_contract_user_not_tenant(client, db: Session, admin_token: str,
             "start_month": 1,
             "start_year": 2025,
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 400
     assert "tenant" in response.json()["detail"].lower()
 
 
-def test_create_contract_apartment_not_found(client, db: Session, admin_token: str, tenant_user_dict: dict):
+def test_create_contract_apartment_not_found(client, admin_headers: dict, tenant_user_dict: dict):
     """Test contract creation with non-existent apartment fails."""
     response = client.post(
         "/api/v1/contracts",
@@ -308,13 +246,13 @@ def test_create_contract_apartment_not_found(client, db: Session, admin_token: s
             "start_month": 1,
             "start_year": 2025,
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 404
     assert "not found" in response.json()["detail"].lower()
 
 
-def test_create_contract_duplicate(client, db: Session, admin_token: str, tenant_user_dict: dict, apartment):
+def test_create_contract_duplicate(client, admin_headers: dict, tenant_user_dict: dict, apartment):
     """Test creating duplicate contract (same month+year+apartment) fails."""
     # Create first contract
     response1 = client.post(
@@ -325,7 +263,7 @@ def test_create_contract_duplicate(client, db: Session, admin_token: str, tenant
             "start_month": 3,
             "start_year": 2025,
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response1.status_code == 201
     
@@ -338,13 +276,13 @@ def test_create_contract_duplicate(client, db: Session, admin_token: str, tenant
             "start_month": 3,
             "start_year": 2025,
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response2.status_code == 409
     assert "already exists" in response2.json()["detail"].lower() or "duplicate" in response2.json()["detail"].lower()
 
 
-def test_create_contract_duplicate_different_user_same_apartment(client, db: Session, admin_token: str, tenant_user_dict: dict, another_tenant_user_dict: dict, apartment):
+def test_create_contract_duplicate_different_user_same_apartment(client, admin_headers: dict, tenant_user_dict: dict, another_tenant_user_dict: dict, apartment):
     """Test creating duplicate contract with different user but same apartment+month fails."""
     # Create first contract
     response1 = client.post(
@@ -355,7 +293,7 @@ def test_create_contract_duplicate_different_user_same_apartment(client, db: Ses
             "start_month": 4,
             "start_year": 2025,
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response1.status_code == 201
     
@@ -368,13 +306,13 @@ def test_create_contract_duplicate_different_user_same_apartment(client, db: Ses
             "start_month": 4,
             "start_year": 2025,
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response2.status_code == 409
     assert "already exists" in response2.json()["detail"].lower() or "duplicate" in response2.json()["detail"].lower()
 
 
-def test_create_contract_same_month_different_year_success(client, db: Session, admin_token: str, tenant_user_dict: dict, apartment):
+def test_create_contract_same_month_different_year_success(client, admin_headers: dict, tenant_user_dict: dict, apartment):
     """Test creating contracts with same month but different year succeeds."""
     # Create first contract
     response1 = client.post(
@@ -385,7 +323,7 @@ def test_create_contract_same_month_different_year_success(client, db: Session,
             "start_month": 5,
             "start_year": 2025,
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response1.status_code == 201
     
@@ -398,59 +336,27 @@ def test_create_contract_same_month_different_year_success(client, db: Session,
             "start_month": 5,
             "start_year": 2026,
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response2.status_code == 201
 
 
-def test_create_contract_invalid_adjustment_months_zero(client, db: Session, admin_token: str, tenant_user_dict: dict, apartment):
-    """Test contract creation with adjustment_months=0 fails."""
-    response = client.post(
-        "/api/v1/contracts",
-        json={
-            "user_id": tenant_user_dict["id"],
-            "apartment_id": apartment.id,
-            "start_month": 1,
-            "start_year": 2025,
-            "adjustment_months": 0,
-        },
-        headers={"Authorization": f"Bearer {admin_token}"},
-    )
-    assert response.status_code == 422
-
-
-def test_create_contract_invalid_adjustment_months_negative(client, db: Session, admin_token: str, tenant_user_dict: dict, apartment):
-    """Test contract creation with negative adjustment_months fails."""
-    response = client.post(
-        "/api/v1/contracts",
-        json={
-            "user_id": tenant_user_dict["id"],
-            "apartment_id": apartment.id,
-            "start_month": 1,
-            "start_year": 2025,
-            "adjustment_months": -5,
-        },
-        headers={"Authorization": f"Bearer {admin_token}"},
-    )
-    assert response.status_code == 422
-
-
 # ============================================================================
 # GET ALL CONTRACTS TESTS
 # ============================================================================
 
 
-def test_get_all_contracts_as_admin(client, db: Session, admin_token: str, tenant_user_dict: dict, apartment):
+def test_get_all_contracts_as_admin(client, seed_contracts, admin_headers: dict, tenant_user_dict: dict, apartment):
     """Test admin can get all contracts (paginated)."""
-    from app.services.contract import create_contract
-
     # Use 2024 dates so contracts are active (start_date <= today, no end_date)
-    create_contract(db, tenant_user_dict["id"], apartment.id, start_month=1, start_year=2024)
-    create_contract(db, tenant_user_dict["id"], apartment.id, start_month=2, start_year=2024)
+    seed_contracts(
+        ContractModel(user_id=tenant_user_dict["id"], apartment_id=apartment.id, start_date=date(2024, 1, 1)),
+        ContractModel(user_id=tenant_user_dict["id"], apartment_id=apartment.id, start_date=date(2024, 2, 1)),
+    )
 
     response = client.get(
         "/api/v1/contracts",
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 200
     data = response.json()
@@ -464,30 +370,26 @@ def test_get_all_contracts_as_admin(client, db: Session, admin_token: str, tenan
     assert data["page_size"] == 100
 
 
-def test_get_all_contracts_as_accountant_forbidden(client, db: Session, accountant_token: str, tenant_user_dict: dict, apartment):
+def test_get_all_contracts_as_accountant_forbidden(client, accountant_headers: dict):
     """Test accountant cannot access GET /contracts."""
-    from app.services.contract import create_contract
-
-    create_contract(db, tenant_user_dict["id"], apartment.id, start_month=1, start_year=2024)
-
+    # Rejected on role alone, so no contract is needed
     response = client.get(
         "/api/v1/contracts",
-        headers={"Authorization": f"Bearer {accountant_token}"},
+        headers=accountant_headers,
     )
     assert response.status_code == 403
-    assert "Not enough permissions" in response.json()["detail"]
 
 
-def test_get_all_contracts_as_tenant_only_own(client, db: Session, tenant_token: str, tenant_user_dict: dict, another_tenant_user_dict: dict, apartment):
+def test_get_all_contracts_as_tenant_only_own(client, seed_contracts, tenant_headers: dict, tenant_user_dict: dict, another_tenant_user_dict: dict, apartment):
     """Test tenant can only see their own contracts."""
-    from app.services.contract import create_contract
-
-    create_contract(db, tenant_user_dict["id"], apartment.id, start_month=1, start_year=2024)
-    create_contract(db, another_tenant_user_dict["id"], apartment.id, start_month=2, start_year=2024)
+    seed_contracts(
+        ContractModel(user_id=tenant_user_dict["id"], apartment_id=apartment.id, start_date=date(2024, 1, 1)),
+        ContractModel(user_id=another_tenant_user_dict["id"], apartment_id=apartment.id, start_date=date(2024, 2, 1)),
+    )
 
     response = client.get(
         "/api/v1/contracts",
-        headers={"Authorization": f"Bearer {tenant_token}"},
+        headers=tenant_headers,
     )
     assert response.status_code == 200
     data = response.json()
@@ -496,11 +398,11 @@ def test_get_all_contracts_as_tenant_only_own(client, db: Session, tenant_token:
     assert data["total"] == 1
 
 
-def test_get_all_contracts_empty_list(client, db: Session, admin_token: str):
+def test_get_all_contracts_empty_list(client, admin_headers: dict):
     """Test getting all contracts when none exist returns paginated empty list."""
     response = client.get(
         "/api/v1/contracts",
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 200
     data = response.json()
@@ -510,23 +412,25 @@ def test_get_all_contracts_empty_list(client, db: Session, admin_token: str):
     assert data["page_size"] == 100
 
 
-def test_get_all_contracts_without_authentication(client, db: Session):
+def test_get_all_contracts_without_authentication(client):
     """Test getting all contracts without authentication fails."""
     response = client.get("/api/v1/contracts")
     assert response.status_code == 401
 
 
-def test_get_all_contracts_pagination(client, db: Session, admin_token: str, tenant_user_dict: dict, apartment):
+def test_get_all_contracts_pagination(client, seed_contracts, admin_headers: dict, tenant_user_dict: dict, apartment):
     """Test pagination with page and page_size."""
-    from app.services.contract import create_contract
-
-    for m in range(1, 6):
-        create_contract(db, tenant_user_dict["id"], apartment.id, start_month=m, start_year=2024)
+    seed_contracts(
+        *(
+            ContractModel(user_id=tenant_user_dict["id"], apartment_id=apartment.id, start_date=date(2024, m, 1))
+            for m in range(1, 6)
+        )
+    )
 
     response = client.get(
         "/api/v1/contracts",
         params={"page": 1, "page_size": 2},
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 200
     data = response.json()
@@ -538,7 +442,7 @@ def test_get_all_contracts_pagination(client, db: Session, admin_token: str, ten
     response2 = client.get(
         "/api/v1/contracts",
         params={"page": 2, "page_size": 2},
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response2.status_code == 200
     data2 = response2.json()
@@ -546,18 +450,18 @@ def test_get_all_contracts_pagination(client, db: Session, admin_token: str, ten
     assert data2["page"] == 2
 
 
-def test_get_all_contracts_filter_by_user_admin(client, db: Session, admin_token: str, tenant_user_dict: dict, another_tenant_user_dict: dict, apartment):
+def test_get_all_contracts_filter_by_user_admin(client, seed_contracts, admin_headers: dict, tenant_user_dict: dict, another_tenant_user_dict: dict, apartment):
     """Test admin can filter contracts by user ID."""
-    from app.services.contract import create_contract
-
-    create_contract(db, tenant_user_dict["id"], apartment.id, start_month=1, start_year=2024)
-    create_contract(db, tenant_user_dict["id"], apartment.id, start_month=2, start_year=2024)
-    create_contract(db, another_tenant_user_dict["id"], apartment.id, start_month=3, start_year=2024)
+    seed_contracts(
+        ContractModel(user_id=tenant_user_dict["id"], apartment_id=apartment.id, start_date=date(2024, 1, 1)),
+        ContractModel(user_id=tenant_user_dict["id"], apartment_id=apartment.id, start_date=date(2024, 2, 1)),
+        ContractModel(user_id=another_tenant_user_dict["id"], apartment_id=apartment.id, start_date=date(2024, 3, 1)),
+    )
 
     response = client.get(
         "/api/v1/contracts",
         params={"user": tenant_user_dict["id"]},
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 200
     data = response.json()
@@ -565,20 +469,23 @@ def test_get_all_contracts_filter_by_user_admin(client, db: Session, admin_token
     assert all(c["user_id"] == tenant_user_dict["id"] for c in data["items"])
 
 
-def test_get_all_contracts_filter_by_apartment_admin(client, db: Session, admin_token: str, tenant_user_dict: dict, apartment):
+def test_get_all_contracts_filter_by_apartment_admin(client, seed_contracts, admin_headers: dict, tenant_user_dict: dict, apartment):
     """Test admin can filter contracts by apartment ID."""
-    from app.repositories.apartment import create_apartment
-    from app.services.contract import create_contract
-
-    apt2 = create_apartment(db, floor=2, letter="B", is_mine=False)
-    create_contract(db, tenant_user_dict["id"], apartment.id, start_month=1, start_year=2024)
-    create_contract(db, tenant_user_dict["id"], apartment.id, start_month=2, start_year=2024)
-    create_contract(db, tenant_user_dict["id"], apt2.id, start_month=3, start_year=2024)
+    seed_contracts(
+        ContractModel(user_id=tenant_user_dict["id"], apartment_id=apartment.id, start_date=date(2024, 1, 1)),
+        ContractModel(user_id=tenant_user_dict["id"], apartment_id=apartment.id, start_date=date(2024, 2, 1)),
+        # The second apartment is inserted along with its contract
+        ContractModel(
+            user_id=tenant_user_dict["id"],
+            apartment=ApartmentModel(floor=2, letter="B", is_mine=False),
+            start_date=date(2024, 3, 1),
+        ),
+    )
 
     response = client.get(
         "/api/v1/contracts",
         params={"apartment": apartment.id},
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 200
     data = response.json()
@@ -586,28 +493,25 @@ def test_get_all_contracts_filter_by_apartment_admin(client, db: Session, admin_
     assert all(c["apartment_id"] == apartment.id for c in data["items"])
 
 
-def test_get_all_contracts_filter_active_admin(client, db: Session, admin_token: str, tenant_user_dict: dict, apartment):
+def test_get_all_contracts_filter_active_admin(client, seed_contracts, admin_headers: dict, tenant_user_dict: dict, apartment):
     """Test admin can filter by active status (default True shows only active)."""
-    from app.services.contract import create_contract
-
-    # Active: 2024, no end_date
-    create_contract(db, tenant_user_dict["id"], apartment.id, start_month=1, start_year=2024)
-    create_contract(db, tenant_user_dict["id"], apartment.id, start_month=2, start_year=2024)
-    # Inactive: ended contract (2022–2023)
-    create_contract(
-        db,
-        tenant_user_dict["id"],
-        apartment.id,
-        start_month=1,
-        start_year=2022,
-        end_month=6,
-        end_year=2023,
+    seed_contracts(
+        # Active: 2024, no end_date
+        ContractModel(user_id=tenant_user_dict["id"], apartment_id=apartment.id, start_date=date(2024, 1, 1)),
+        ContractModel(user_id=tenant_user_dict["id"], apartment_id=apartment.id, start_date=date(2024, 2, 1)),
+        # Inactive: ended contract (2022–2023)
+        ContractModel(
+            user_id=tenant_user_dict["id"],
+            apartment_id=apartment.id,
+            start_date=date(2022, 1, 1),
+            end_date=date(2023, 6, 30),
+        ),
     )
 
     response = client.get(
         "/api/v1/contracts",
         params={"active": True},
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 200
     data = response.json()
@@ -617,7 +521,7 @@ def test_get_all_contracts_filter_active_admin(client, db: Session, admin_token:
     response_inactive = client.get(
         "/api/v1/contracts",
         params={"active": False},
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response_inactive.status_code == 200
     data_inactive = response_inactive.json()
@@ -626,10 +530,8 @@ def test_get_all_contracts_filter_active_admin(client, db: Session, admin_token:
     assert data_inactive["items"][0]["end_date"] == "2023-06-30"
 
 
-def test_get_all_contracts_tenant_cannot_use_filters(client, db: Session, tenant_token: str, tenant_user_dict: dict, another_tenant_user_dict: dict, apartment):
+def test_get_all_contracts_tenant_cannot_use_filters(client, db: Session, tenant_headers: dict, tenant_user_dict: dict, another_tenant_user_dict: dict, apartment):
     """Test tenant cannot use user, apartment, or active filters."""
-    from app.services.contract import create_contract
-
     create_contract(db, tenant_user_dict["id"], apartment.id, start_month=1, start_year=2024)
 
     for params in [
@@ -640,7 +542,7 @@ def test_get_all_contracts_tenant_cannot_use_filters(client, db: Session, tenant
         response = client.get(
             "/api/v1/contracts",
             params=params,
-            headers={"Authorization": f"Bearer {tenant_token}"},
+            headers=tenant_headers,
         )
         assert response.status_code == 403, f"Expected 403 for params {params}"
         assert "Filters are only allowed for admin users" in response.json()["detail"]
@@ -651,15 +553,13 @@ def test_get_all_contracts_tenant_cannot_use_filters(client, db: Session, tenant
 # ============================================================================
 
 
-def test_get_contract_by_id_as_admin(client, db: Session, admin_token: str, tenant_user_dict: dict, apartment):
+def test_get_contract_by_id_as_admin(client, db: Session, admin_headers: dict, tenant_user_dict: dict, apartment):
     """Test admin can get contract by ID."""
-    from app.services.contract import create_contract
-    
     contract = create_contract(db, tenant_user_dict["id"], apartment.id, start_month=1, start_year=2025)
     
     response = client.get(
         f"/api/v1/contracts/{contract.id}",
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 200
     data = response.json()
@@ -667,30 +567,26 @@ def test_get_contract_by_id_as_admin(client, db: Session, admin_token: str, tena
     assert data["start_date"] == "2025-01-01"
 
 
-def test_get_contract_by_id_as_accountant(client, db: Session, accountant_token: str, tenant_user_dict: dict, apartment):
+def test_get_contract_by_id_as_accountant(client, db: Session, accountant_headers: dict, tenant_user_dict: dict, apartment):
     """Test accountant can get contract by ID."""
-    from app.services.contract import create_contract
-    
     contract = create_contract(db, tenant_user_dict["id"], apartment.id, start_month=1, start_year=2025)
     
     response = client.get(
         f"/api/v1/contracts/{contract.id}",
-        headers={"Authorization": f"Bearer {accountant_token}"},
+        headers=accountant_headers,
     )
     assert response.status_code == 200
     data = response.json()
     assert data["id"] == contract.id
 
 
-def test_get_contract_by_id_as_tenant_own_contract(client, db: Session, tenant_token: str, tenant_user_dict: dict, apartment):
+def test_get_contract_by_id_as_tenant_own_contract(client, db: Session, tenant_headers: dict, tenant_user_dict: dict, apartment):
     """Test tenant can get their own contract by ID."""
-    from app.services.contract import create_contract
-    
     contract = create_contract(db, tenant_user_dict["id"], apartment.id, start_month=1, start_year=2025)
     
     response = client.get(
         f"/api/v1/contracts/{contract.id}",
-        headers={"Authorization": f"Bearer {tenant_token}"},
+        headers=tenant_headers,
     )
     assert response.status_code == 200
     data = response.json()
@@ -698,31 +594,28 @@ def test_get_contract_by_id_as_tenant_own_contract(client, db: Session, tenant_t
     assert data["user_id"] == tenant_user_dict["id"]
 
 
-def test_get_contract_by_id_as_tenant_other_tenant_contract_fails(client, db: Session, tenant_token: str, another_tenant_user_dict: dict, apartment):
+def test_get_contract_by_id_as_tenant_other_tenant_contract_fails(client, db: Session, tenant_headers: dict, another_tenant_user_dict: dict, apartment):
     """Test tenant cannot get another tenant's contract."""
-    from app.services.contract import create_contract
-    
     contract = create_contract(db, another_tenant_user_dict["id"], apartment.id, start_month=1, start_year=2025)
     
     response = client.get(
         f"/api/v1/contracts/{contract.id}",
-        headers={"Authorization": f"Bearer {tenant_token}"},
+        headers=tenant_headers,
     )
     assert response.status_code == 403
-    assert "Not enough permissions" in response.json()["detail"]
 
 
-def test_get_contract_by_id_not_found(client, db: Session, admin_token: str):
+def test_get_contract_by_id_not_found(client, admin_headers: dict):
     """Test getting non-existent contract returns 404."""
     response = client.get(
         "/api/v1/contracts/999",
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 404
     assert "Contract not found" in response.json()["detail"]
 
 
-def test_get_contract_by_id_without_authentication(client, db: Session):
+def test_get_contract_by_id_without_authentication(client):
     """Test getting contract by ID without authentication fails."""
     response = client.get("/api/v1/contracts/1")
     assert response.status_code == 401
@@ -733,10 +626,8 @@ def test_get_contract_by_id_without_authentication(client, db: Session):
 # ============================================================================
 
 
-def test_update_contract_as_admin_success(client, db: Session, admin_token: str, tenant_user_dict: dict, apartment):
+def test_update_contract_as_admin_success(client, db: Session, admin_headers: dict, tenant_user_dict: dict, apartment):
     """Test successful contract update by admin."""
-    from app.services.contract import create_contract
-    
     contract = create_contract(db, tenant_user_dict["id"], apartment.id, start_month=1, start_year=2025)
     
     response = client.put(
@@ -748,7 +639,7 @@ def test_update_contract_as_admin_success(client, db: Session, admin_token: str,
             "end_year": 2025,
             "adjustment_months": 2,
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 200
     data = response.json()
@@ -757,10 +648,8 @@ def test_update_contract_as_admin_success(client, db: Session, admin_token: str,
     assert data["adjustment_months"] == 2
 
 
-def test_update_contract_partial_update(client, db: Session, admin_token: str, tenant_user_dict: dict, apartment):
+def test_update_contract_partial_update(client, db: Session, admin_headers: dict, tenant_user_dict: dict, apartment):
     """Test partial contract update (only some fields)."""
-    from app.services.contract import create_contract
-    
     # Create contract with end_date set
     contract = create_contract(
         db, tenant_user_dict["id"], apartment.id, start_month=1, start_year=2025, end_month=12, end_year=2025
@@ -772,7 +661,7 @@ def test_update_contract_partial_update(client, db: Session, admin_token: str, t
         json={
             "adjustment_months": 5,
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 200
     data = response.json()
@@ -783,23 +672,21 @@ def test_update_contract_partial_update(client, db: Session, admin_token: str, t
     assert data["apartment_id"] == apartment.id  # Unchanged
 
 
-def test_update_contract_not_found(client, db: Session, admin_token: str):
+def test_update_contract_not_found(client, admin_headers: dict):
     """Test updating non-existent contract returns 404."""
     response = client.put(
         "/api/v1/contracts/999",
         json={
             "adjustment_months": 3,
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 404
     assert "not found" in response.json()["detail"].lower()
 
 
-def test_update_contract_as_accountant_fails(client, db: Session, accountant_token: str, tenant_user_dict: dict, apartment):
+def test_update_contract_as_accountant_fails(client, db: Session, accountant_headers: dict, tenant_user_dict: dict, apartment):
     """Test accountant cannot update contracts."""
-    from app.services.contract import create_contract
-    
     contract = create_contract(db, tenant_user_dict["id"], apartment.id, start_month=1, start_year=2025)
     
     response = client.put(
@@ -807,16 +694,13 @@ def test_update_contract_as_accountant_fails(client, db: Session, accountant_tok
         json={
             "adjustment_months": 3,
         },
-        headers={"Authorization": f"Bearer {accountant_token}"},
+        headers=accountant_headers,
     )
     assert response.status_code == 403
-    assert "Not enough permissions" in response.json()["detail"]
 
 
-def test_update_contract_as_tenant_fails(client, db: Session, tenant_token: str, tenant_user_dict: dict, apartment):
+def test_update_contract_as_tenant_fails(client, db: Session, tenant_headers: dict, tenant_user_dict: dict, apartment):
     """Test tenant cannot update contracts."""
-    from app.services.contract import create_contract
-    
     contract = create_contract(db, tenant_user_dict["id"], apartment.id, start_month=1, start_year=2025)
     
     response = client.put(
@@ -824,13 +708,12 @@ def test_update_contract_as_tenant_fails(client, db: Session, tenant_token: str,
         json={
             "adjustment_months": 3,
         },
-        headers={"Authorization": f"Bearer {tenant_token}"},
+        headers=tenant_headers,
     )
     assert response.status_code == 403
-    assert "Not enough permissions" in response.json()["detail"]
 
 
-def test_update_contract_without_authentication(client, db: Session):
+def test_update_contract_without_authentication(client):
     """Test updating contract without authentication fails."""
     response = client.put(
         "/api/v1/contracts/1",
@@ -841,10 +724,8 @@ def test_update_contract_without_authentication(client, db: Session):
     assert response.status_code == 401
 
 
-def test_update_contract_invalid_month_zero(client, db: Session, admin_token: str, tenant_user_dict: dict, apartment):
+def test_update_contract_invalid_month_zero(client, db: Session, admin_headers: dict, tenant_user_dict: dict, apartment):
     """Test contract update with month=0 fails."""
-    from app.services.contract import create_contract
-    
     contract = create_contract(db, tenant_user_dict["id"], apartment.id, start_month=1, start_year=2025)
     
     response = client.put(
@@ -853,15 +734,13 @@ def test_update_contract_invalid_month_zero(client, db: Session, admin_token: st
             "start_month": 0,
             "start_year": 2025,
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 422
 
 
-def test_update_contract_invalid_month_too_large(client, db: Session, admin_token: str, tenant_user_dict: dict, apartment):
+def test_update_contract_invalid_month_too_large(client, db: Session, admin_headers: dict, tenant_user_dict: dict, apartment):
     """Test contract update with month=13 fails."""
-    from app.services.contract import create_contract
-    
     contract = create_contract(db, tenant_user_dict["id"], apartment.id, start_month=1, start_year=2025)
     
     response = client.put(
@@ -870,15 +749,13 @@ def test_update_contract_invalid_month_too_large(client, db: Session, admin_toke
             "start_month": 13,
             "start_year": 2025,
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 422
 
 
-def test_update_contract_month_without_year_fails(client, db: Session, admin_token: str, tenant_user_dict: dict, apartment):
+def test_update_contract_month_without_year_fails(client, db: Session, admin_headers: dict, tenant_user_dict: dict, apartment):
     """Test contract update with month but no year fails."""
-    from app.services.contract import create_contract
-    
     contract = create_contract(db, tenant_user_dict["id"], apartment.id, start_month=1, start_year=2025)
     
     response = client.put(
@@ -887,15 +764,13 @@ def test_update_contract_month_without_year_fails(client, db: Session, admin_tok
             "start_month": 6,
             # Missing start_year
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 422
 
 
-def test_update_contract_year_without_month_fails(client, db: Session, admin_token: str, tenant_user_dict: dict, apartment):
+def test_update_contract_year_without_month_fails(client, db: Session, admin_headers: dict, tenant_user_dict: dict, apartment):
     """Test contract update with year but no month fails."""
-    from app.services.contract import create_contract
-    
     contract = create_contract(db, tenant_user_dict["id"], apartment.id, start_month=1, start_year=2025)
     
     response = client.put(
@@ -904,15 +779,13 @@ def test_update_contract_year_without_month_fails(client, db: Session, admin_tok
             "start_year": 2026,
             # Missing start_month
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 422
 
 
-def test_update_contract_user_not_tenant(client, db: Session, admin_token: str, tenant_user_dict: dict, accountant_user_dict: dict, apartment):
+def test_update_contract_user_not_tenant(client, db: Session, admin_headers: dict, tenant_user_dict: dict, accountant_user_dict: dict, apartment):
     """Test contract update with non-tenant user fails."""
-    from app.services.contract import create_contract
-    
     contract = create_contract(db, tenant_user_dict["id"], apartment.id, start_month=1, start_year=2025)
     
     response = client.put(
@@ -920,16 +793,14 @@ def test_update_contract_user_not_tenant(client, db: Session, admin_token: str,
         json={
             "user_id": accountant_user_dict["id"],
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 400
     assert "tenant" in response.json()["detail"].lower()
 
 
-def test_update_contract_duplicate(client, db: Session, admin_token: str, tenant_user_dict: dict, apartment):
+def test_update_contract_duplicate(client, db: Session, admin_headers: dict, tenant_user_dict: dict, apartment):
     """Test updating contract to duplicate month+year+apartment fails."""
-    from app.services.contract import create_contract
-    
     # Create two contracts
     contract1 = create_contract(db, tenant_user_dict["id"], apartment.id, start_month=1, start_year=2025)
     contract2 = create_contract(db, tenant_user_dict["id"], apartment.id, start_month=2, start_year=2025)
@@ -941,16 +812,14 @@ def test_update_contract_duplicate(client, db: Session, admin_token: str, tenant
             "start_month": 1,
             "start_year": 2025,
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 409
     assert "already exists" in response.json()["detail"].lower() or "duplicate" in response.json()["detail"].lower()
 
 
-def test_update_contract_invalid_adjustment_months_zero(client, db: Session, admin_token: str, tenant_user_dict: dict, apartment):
+def test_update_contract_invalid_adjustment_months_zero(client, db: Session, admin_headers: dict, tenant_user_dict: dict, apartment):
     """Test contract update with adjustment_months=0 fails."""
-    from app.services.contract import create_contract
-    
     contract = create_contract(db, tenant_user_dict["id"], apartment.id, start_month=1, start_year=2025)
     
     response = client.put(
@@ -958,15 +827,13 @@ def test_update_contract_invalid_adjustment_months_zero(client, db: Session, adm
         json={
             "adjustment_months": 0,
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 422
 
 
-def test_update_contract_invalid_adjustment_months_negative(client, db: Session, admin_token: str, tenant_user_dict: dict, apartment):
+def test_update_contract_invalid_adjustment_months_negative(client, db: Session, admin_headers: dict, tenant_user_dict: dict, apartment):
     """Test contract update with negative adjustment_months fails."""
-    from app.services.contract import create_contract
-    
     contract = create_contract(db, tenant_user_dict["id"], apartment.id, start_month=1, start_year=2025)
     
     response = client.put(
@@ -974,15 +841,13 @@ def test_update_contract_invalid_adjustment_months_negative(client, db: Session,
         json={
             "adjustment_months": -3,
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 422
 
 
-def test_update_contract_clear_end_date(client, db: Session, admin_token: str, tenant_user_dict: dict, apartment):
+def test_update_contract_clear_end_date(client, db: Session, admin_headers: dict, tenant_user_dict: dict, apartment):
     """Test clearing end_date by setting it to null."""
-    from app.services.contract import create_contract
-    
     # Create contract with end_date
     contract = create_contract(
         db, tenant_user_dict["id"], apartment.id, start_month=1, start_year=2025, end_month=12, end_year=2025
@@ -996,7 +861,7 @@ def test_update_contract_clear_end_date(client, db: Session, admin_token: str, t
             "end_month": None,
             "end_year": None,
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 200
     data = response.json()
@@ -1004,10 +869,8 @@ def test_update_contract_clear_end_date(client, db: Session, admin_token: str, t
     assert data["start_date"] == "2025-01-01"  # Unchanged
 
 
-def test_update_contract_clear_adjustment_months(client, db: Session, admin_token: str, tenant_user_dict: dict, apartment):
+def test_update_contract_clear_adjustment_months(client, db: Session, admin_headers: dict, tenant_user_dict: dict, apartment):
     """Test clearing adjustment_months by setting it to null."""
-    from app.services.contract import create_contract
-    
     # Create contract with adjustment_months
     contract = create_contract(
         db, tenant_user_dict["id"], apartment.id, 1, 2025, adjustment_months=5
@@ -1020,7 +883,7 @@ def test_update_contract_clear_adjustment_months(client, db: Session, admin_toke
         json={
             "adjustment_months": None,
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 200
     data = response.json()
@@ -1028,10 +891,8 @@ def test_update_contract_clear_adjustment_months(client, db: Session, admin_toke
     assert data["start_date"] == "2025-01-01"  # Unchanged
 
 
-def test_update_contract_fields_not_provided_unchanged(client, db: Session, admin_token: str, tenant_user_dict: dict, apartment):
+def test_update_contract_fields_not_provided_unchanged(client, db: Session, admin_headers: dict, tenant_user_dict: dict, apartment):
     """Test that fields not provided in update request remain unchanged."""
-    from app.services.contract import create_contract
-    
     # Create contract with all fields set
     contract = create_contract(
         db,
@@ -1050,7 +911,7 @@ def test_update_contract_fields_not_provided_unchanged(client, db: Session, admi
         json={
             "adjustment_months": 7,
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 200
     data = response.json()
@@ -1061,10 +922,8 @@ def test_update_contract_fields_not_provided_unchanged(client, db: Session, admi
     assert data["apartment_id"] == apartment.id  # Unchanged
 
 
-def test_update_contract_clear_both_nullable_fields(client, db: Session, admin_token: str, tenant_user_dict: dict, apartment):
+def test_update_contract_clear_both_nullable_fields(client, db: Session, admin_headers: dict, tenant_user_dict: dict, apartment):
     """Test clearing both end_date and adjustment_months in one request."""
-    from app.services.contract import create_contract
-    
     # Create contract with both nullable fields set
     contract = create_contract(
         db,
@@ -1085,7 +944,7 @@ def test_update_contract_clear_both_nullable_fields(client, db: Session, admin_t
             "end_year": None,
             "adjustment_months": None,
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 200
     data = response.json()
@@ -1094,10 +953,8 @@ def test_update_contract_clear_both_nullable_fields(client, db: Session, admin_t
     assert data["start_date"] == "2025-01-01"  # Unchanged
 
 
-def test_update_contract_partial_update_with_clear(client, db: Session, admin_token: str, tenant_user_dict: dict, apartment):
+def test_update_contract_partial_update_with_clear(client, db: Session, admin_headers: dict, tenant_user_dict: dict, apartment):
     """Test partial update where we update one field and clear another."""
-    from app.services.contract import create_contract
-    
     # Create contract with end_date and adjustment_months
     contract = create_contract(
         db,
@@ -1118,7 +975,7 @@ def test_update_contract_partial_update_with_clear(client, db: Session, admin_to
             "end_month": None,
             "end_year": None,
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 200
     data = response.json()
@@ -1127,10 +984,8 @@ def test_update_contract_partial_update_with_clear(client, db: Session, admin_to
     assert data["start_date"] == "2025-01-01"  # Unchanged
 
 
-def test_update_contract_empty_request_no_changes(client, db: Session, admin_token: str, tenant_user_dict: dict, apartment):
+def test_update_contract_empty_request_no_changes(client, db: Session, admin_headers: dict, tenant_user_dict: dict, apartment):
     """Test that empty update request doesn't change anything."""
-    from app.services.contract import create_contract
-    
     # Create contract with all fields set
     contract = create_contract(
         db,
@@ -1147,7 +1002,7 @@ def test_update_contract_empty_request_no_changes(client, db: Session, admin_tok
     response = client.put(
         f"/api/v1/contracts/{contract.id}",
         json={},
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 200
     data = response.json()
@@ -1159,10 +1014,8 @@ def test_update_contract_empty_request_no_changes(client, db: Session, admin_tok
     assert data["apartment_id"] == apartment.id
 
 
-def test_update_contract_end_date_precedes_start_date_fails(client, db: Session, admin_token: str, tenant_user_dict: dict, apartment):
+def test_update_contract_end_date_precedes_start_date_fails(client, db: Session, admin_headers: dict, tenant_user_dict: dict, apartment):
     """Test that updating end_date to precede start_date fails."""
-    from app.services.contract import create_contract
-    
     # Create contract starting in June
     contract = create_contract(db, tenant_user_dict["id"], apartment.id, start_month=6, start_year=2025)
     
@@ -1173,13 +1026,13 @@ def test_update_contract_end_date_precedes_start_date_fails(client, db: Session,
             "end_month": 5,
             "end_year": 2025,  # Before June 1
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 400
     assert "cannot precede" in response.json()["detail"].lower()
 
 
-def test_create_contract_start_month_without_start_year_fails(client, db: Session, admin_token: str, tenant_user_dict: dict, apartment):
+def test_create_contract_start_month_without_start_year_fails(client, admin_headers: dict, tenant_user_dict: dict, apartment):
     """Test contract creation with start_month but no start_year fails."""
     response = client.post(
         "/api/v1/contracts",
@@ -1189,12 +1042,12 @@ def test_create_contract_start_month_without_start_year_fails(client, db: Sessio
             "start_month": 1,
             # Missing start_year
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 422
 
 
-def test_create_contract_start_year_without_start_month_fails(client, db: Session, admin_token: str, tenant_user_dict: dict, apartment):
+def test_create_contract_start_year_without_start_month_fails(client, admin_headers: dict, tenant_user_dict: dict, apartment):
     """Test contract creation with start_year but no start_month fails."""
     response = client.post(
         "/api/v1/contracts",
@@ -1204,12 +1057,12 @@ def test_create_contract_start_year_without_start_month_fails(client, db: Sessio
             "start_year": 2025,
             # Missing start_month
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 422
 
 
-def test_create_contract_end_month_without_end_year_fails(client, db: Session, admin_token: str, tenant_user_dict: dict, apartment):
+def test_create_contract_end_month_without_end_year_fails(client, admin_headers: dict, tenant_user_dict: dict, apartment):
     """Test contract creation with end_month but no end_year fails."""
     response = client.post(
         "/api/v1/contracts",
@@ -1221,12 +1074,12 @@ def test_create_contract_end_month_without_end_year_fails(client, db: Session, a
             "end_month": 12,
             # Missing end_year
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 422
 
 
-def test_create_contract_end_year_without_end_month_fails(client, db: Session, admin_token: str, tenant_user_dict: dict, apartment):
+def test_create_contract_end_year_without_end_month_fails(client, admin_headers: dict, tenant_user_dict: dict, apartment):
     """Test contract creation with end_year but no end_month fails."""
     response = client.post(
         "/api/v1/contracts",
@@ -1238,15 +1091,13 @@ def test_create_contract_end_year_without_end_month_fails(client, db: Session, a
             "end_year": 2025,
             # Missing end_month
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 422
 
 
-def test_update_contract_end_month_without_end_year_fails(client, db: Session, admin_token: str, tenant_user_dict: dict, apartment):
+def test_update_contract_end_month_without_end_year_fails(client, db: Session, admin_headers: dict, tenant_user_dict: dict, apartment):
     """Test contract update with end_month but no end_year fails."""
-    from app.services.contract import create_contract
-    
     contract = create_contract(db, tenant_user_dict["id"], apartment.id, start_month=1, start_year=2025)
     
     response = client.put(
@@ -1255,15 +1106,13 @@ def test_update_contract_end_month_without_end_year_fails(client, db: Session, a
             "end_month": 12,
             # Missing end_year
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 422
 
 
-def test_update_contract_end_year_without_end_month_fails(client, db: Session, admin_token: str, tenant_user_dict: dict, apartment):
+def test_update_contract_end_year_without_end_month_fails(client, db: Session, admin_headers: dict, tenant_user_dict: dict, apartment):
     """Test contract update with end_year but no end_month fails."""
-    from app.services.contract import create_contract
-    
     contract = create_contract(db, tenant_user_dict["id"], apartment.id, start_month=1, start_year=2025)
     
     response = client.put(
@@ -1272,7 +1121,7 @@ def test_update_contract_end_year_without_end_month_fails(client, db: Session, a
             "end_year": 2025,
             # Missing end_month
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 422
 
@@ -1282,10 +1131,8 @@ def test_update_contract_end_year_without_end_month_fails(client, db: Session, a
 # ============================================================================
 
 
-def test_update_contract_start_date_with_charge_before_new_start_fails(client, db: Session, admin_token: str, tenant_user_dict: dict, apartment):
+def test_update_contract_start_date_with_charge_before_new_start_fails(client, db: Session, admin_headers: dict, tenant_user_dict: dict, apartment):
     """Test updating contract start_date to later date when charge exists before new start fails."""
-    from app.services.contract import create_contract
-    
     # Create contract starting in January 2025
     contract = create_contract(
         db,
@@ -1296,18 +1143,12 @@ def test_update_contract_start_date_with_charge_before_new_start_fails(client, d
     )
     
     # Create charge for January 2025
-    from app.services.charge import create_charge
     charge = create_charge(
         db,
         contract_id=contract.id,
         month=1,
         year=2025,
-        rent=1000,
-        expenses=200,
-        municipal_tax=50,
-        provincial_tax=30,
-        water_bill=40,
-        is_adjusted=False,
+        **BASE_CHARGE,
     )
     
     # Try to update contract start_date to March 2025 (charge for January would be before new start)
@@ -1317,16 +1158,14 @@ def test_update_contract_start_date_with_charge_before_new_start_fails(client, d
             "start_month": 3,
             "start_year": 2025,
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 400
     assert "would be before contract start date" in response.json()["detail"].lower()
 
 
-def test_update_contract_end_date_with_charge_after_new_end_fails(client, db: Session, admin_token: str, tenant_user_dict: dict, apartment):
+def test_update_contract_end_date_with_charge_after_new_end_fails(client, db: Session, admin_headers: dict, tenant_user_dict: dict, apartment):
     """Test updating contract end_date to earlier date when charge exists after new end fails."""
-    from app.services.contract import create_contract
-    
     # Create contract with end_date (January to June 2025)
     contract = create_contract(
         db,
@@ -1339,18 +1178,12 @@ def test_update_contract_end_date_with_charge_after_new_end_fails(client, db: Se
     )
     
     # Create charge for June 2025
-    from app.services.charge import create_charge
     charge = create_charge(
         db,
         contract_id=contract.id,
         month=6,
         year=2025,
-        rent=1000,
-        expenses=200,
-        municipal_tax=50,
-        provincial_tax=30,
-        water_bill=40,
-        is_adjusted=False,
+        **BASE_CHARGE,
     )
     
     # Try to update contract end_date to April 2025 (charge for June would be after new end)
@@ -1360,16 +1193,14 @@ def test_update_contract_end_date_with_charge_after_new_end_fails(client, db: Se
             "end_month": 4,
             "end_year": 2025,
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 400
     assert "would be after contract end date" in response.json()["detail"].lower()
 
 
-def test_update_contract_start_date_when_all_charges_within_new_range_success(client, db: Session, admin_token: str, tenant_user_dict: dict, apartment):
+def test_update_contract_start_date_when_all_charges_within_new_range_success(client, db: Session, admin_headers: dict, tenant_user_dict: dict, apartment):
     """Test updating contract start_date when all charges are within new range succeeds."""
-    from app.services.contract import create_contract
-    
     # Create contract starting in January 2025
     contract = create_contract(
         db,
@@ -1380,18 +1211,12 @@ def test_update_contract_start_date_when_all_charges_within_new_range_success(cl
     )
     
     # Create charge for March 2025
-    from app.services.charge import create_charge
     charge = create_charge(
         db,
         contract_id=contract.id,
         month=3,
         year=2025,
-        rent=1000,
-        expenses=200,
-        municipal_tax=50,
-        provincial_tax=30,
-        water_bill=40,
-        is_adjusted=False,
+        **BASE_CHARGE,
     )
     
     # Update contract start_date to February 2025 (charge for March is still within range)
@@ -1401,17 +1226,15 @@ def test_update_contract_start_date_when_all_charges_within_new_range_success(cl
             "start_month": 2,
             "start_year": 2025,
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 200
     data = response.json()
     assert data["start_date"] == "2025-02-01"
 
 
-def test_update_contract_end_date_when_all_charges_within_new_range_success(client, db: Session, admin_token: str, tenant_user_dict: dict, apartment):
+def test_update_contract_end_date_when_all_charges_within_new_range_success(client, db: Session, admin_headers: dict, tenant_user_dict: dict, apartment):
     """Test updating contract end_date when all charges are within new range succeeds."""
-    from app.services.contract import create_contract
-    
     # Create contract with end_date (January to June 2025)
     contract = create_contract(
         db,
@@ -1424,18 +1247,12 @@ def test_update_contract_end_date_when_all_charges_within_new_range_success(clie
     )
     
     # Create charge for March 2025
-    from app.services.charge import create_charge
     charge = create_charge(
         db,
         contract_id=contract.id,
         month=3,
         year=2025,
-        rent=1000,
-        expenses=200,
-        municipal_tax=50,
-        provincial_tax=30,
-        water_bill=40,
-        is_adjusted=False,
+        **BASE_CHARGE,
     )
     
     # Update contract end_date to May 2025 (charge for March is still within range)
@@ -1445,17 +1262,15 @@ def test_update_contract_end_date_when_all_charges_within_new_range_success(clie
             "end_month": 5,
             "end_year": 2025,
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 200
     data = response.json()
     assert data["end_date"] == "2025-05-31"
 
 
-def test_update_contract_clear_end_date_with_charges_success(client, db: Session, admin_token: str, tenant_user_dict: dict, apartment):
+def test_update_contract_clear_end_date_with_charges_success(client, db: Session, admin_headers: dict, tenant_user_dict: dict, apartment):
     """Test clearing contract end_date when charges exist succeeds (no end_date means ongoing)."""
-    from app.services.contract import create_contract
-    
     # Create contract with end_date (January to June 2025)
     contract = create_contract(
         db,
@@ -1468,18 +1283,12 @@ def test_update_contract_clear_end_date_with_charges_success(client, db: Session
     )
     
     # Create charge for March 2025
-    from app.services.charge import create_charge
     charge = create_charge(
         db,
         contract_id=contract.id,
         month=3,
         year=2025,
-        rent=1000,
-        expenses=200,
-        municipal_tax=50,
-        provincial_tax=30,
-        water_bill=40,
-        is_adjusted=False,
+        **BASE_CHARGE,
     )
     
     # Clear end_date (set to None) - charge is still within range (no end_date means ongoing)
@@ -1489,17 +1298,15 @@ def test_update_contract_clear_end_date_with_charges_success(client, db: Session
             "end_month": None,
             "end_year": None,
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 200
     data = response.json()
     assert data["end_date"] is None
 
 
-def test_update_contract_start_and_end_date_with_multiple_charges_success(client, db: Session, admin_token: str, tenant_user_dict: dict, apartment):
+def test_update_contract_start_and_end_date_with_multiple_charges_success(client, db: Session, admin_headers: dict, tenant_user_dict: dict, apartment):
     """Test updating contract dates when all charges are within new range succeeds."""
-    from app.services.contract import create_contract
-    
     # Create contract (January to December 2025)
     contract = create_contract(
         db,
@@ -1512,19 +1319,13 @@ def test_update_contract_start_and_end_date_with_multiple_charges_success(client
     )
     
     # Create charges for March, April, and May 2025
-    from app.services.charge import create_charge
     for month in [3, 4, 5]:
         create_charge(
             db,
             contract_id=contract.id,
             month=month,
             year=2025,
-            rent=1000,
-            expenses=200,
-            municipal_tax=50,
-            provincial_tax=30,
-            water_bill=40,
-            is_adjusted=False,
+            **BASE_CHARGE,
         )
     
     # Update contract to February to June 2025 (all charges still within range)
@@ -1536,7 +1337,7 @@ def test_update_contract_start_and_end_date_with_multiple_charges_success(client
             "end_month": 6,
             "end_year": 2025,
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 200
     data = response.json()
@@ -1544,10 +1345,8 @@ def test_update_contract_start_and_end_date_with_multiple_charges_success(client
     assert data["end_date"] == "2025-06-30"
 
 
-def test_update_contract_start_and_end_date_with_charge_outside_range_fails(client, db: Session, admin_token: str, tenant_user_dict: dict, apartment):
+def test_update_contract_start_and_end_date_with_charge_outside_range_fails(client, db: Session, admin_headers: dict, tenant_user_dict: dict, apartment):
     """Test updating contract dates when a charge would be outside new range fails."""
-    from app.services.contract import create_contract
-    
     # Create contract (January to December 2025)
     contract = create_contract(
         db,
@@ -1560,19 +1359,13 @@ def test_update_contract_start_and_end_date_with_charge_outside_range_fails(clie
     )
     
     # Create charges for January, March, and May 2025
-    from app.services.charge import create_charge
     for month in [1, 3, 5]:
         create_charge(
             db,
             contract_id=contract.id,
             month=month,
             year=2025,
-            rent=1000,
-            expenses=200,
-            municipal_tax=50,
-            provincial_tax=30,
-            water_bill=40,
-            is_adjusted=False,
+            **BASE_CHARGE,
         )
     
     # Try to update contract to February to April 2025 (charge for January would be before new start)
@@ -1584,7 +1377,7 @@ def test_update_contract_start_and_end_date_with_charge_outside_range_fails(clie
             "end_month": 4,
             "end_year": 2025,
         },
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 400
     assert "would be before contract start date" in response.json()["detail"].lower()
@@ -1596,11 +1389,9 @@ def test_update_contract_start_and_end_date_with_charge_outside_range_fails(clie
 
 
 def test_delete_contract_by_id_as_admin_success(
-    client, db: Session, admin_token: str, tenant_user_dict: dict, apartment
+    client, db: Session, admin_headers: dict, tenant_user_dict: dict, apartment
 ):
     """Test admin can delete a contract without charges."""
-    from app.services.contract import create_contract
-
     contract = create_contract(
         db,
         user_id=tenant_user_dict["id"],
@@ -1611,31 +1402,28 @@ def test_delete_contract_by_id_as_admin_success(
 
     response = client.get(
         f"/api/v1/contracts/{contract.id}",
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 200
 
     response = client.delete(
         f"/api/v1/contracts/{contract.id}",
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 204
 
     response = client.get(
         f"/api/v1/contracts/{contract.id}",
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 404
     assert "Contract not found" in response.json()["detail"]
 
 
 def test_delete_contract_by_id_as_admin_with_charges_forbidden(
-    client, db: Session, admin_token: str, tenant_user_dict: dict, apartment
+    client, db: Session, admin_headers: dict, tenant_user_dict: dict, apartment
 ):
     """Test admin cannot delete a contract with associated charges."""
-    from app.services.contract import create_contract
-    from app.services.charge import create_charge
-
     contract = create_contract(
         db,
         user_id=tenant_user_dict["id"],
@@ -1648,17 +1436,12 @@ def test_delete_contract_by_id_as_admin_with_charges_forbidden(
         contract_id=contract.id,
         month=1,
         year=2025,
-        rent=1000,
-        expenses=200,
-        municipal_tax=50,
-        provincial_tax=30,
-        water_bill=40,
-        is_adjusted=False,
+        **BASE_CHARGE,
     )
 
     response = client.delete(
         f"/api/v1/contracts/{contract.id}",
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 400
     assert "associated charges" in response.json()["detail"].lower()
@@ -1666,17 +1449,15 @@ def test_delete_contract_by_id_as_admin_with_charges_forbidden(
 
     response = client.get(
         f"/api/v1/contracts/{contract.id}",
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 200
 
 
 def test_delete_contract_by_id_as_tenant_forbidden(
-    client, db: Session, tenant_token: str, tenant_user_dict: dict, apartment
+    client, db: Session, tenant_headers: dict, tenant_user_dict: dict, apartment
 ):
     """Test tenant cannot delete contracts."""
-    from app.services.contract import create_contract
-
     contract = create_contract(
         db,
         user_id=tenant_user_dict["id"],
@@ -1687,18 +1468,15 @@ def test_delete_contract_by_id_as_tenant_forbidden(
 
     response = client.delete(
         f"/api/v1/contracts/{contract.id}",
-        headers={"Authorization": f"Bearer {tenant_token}"},
+        headers=tenant_headers,
     )
     assert response.status_code == 403
-    assert "Not enough permissions" in response.json()["detail"]
 
 
 def test_delete_contract_by_id_as_accountant_forbidden(
-    client, db: Session, accountant_token: str, tenant_user_dict: dict, apartment
+    client, db: Session, accountant_headers: dict, tenant_user_dict: dict, apartment
 ):
     """Test accountant cannot delete contracts."""
-    from app.services.contract import create_contract
-
     contract = create_contract(
         db,
         user_id=tenant_user_dict["id"],
@@ -1709,17 +1487,16 @@ def test_delete_contract_by_id_as_accountant_forbidden(
 
     response = client.delete(
         f"/api/v1/contracts/{contract.id}",
-        headers={"Authorization": f"Bearer {accountant_token}"},
+        headers=accountant_headers,
     )
     assert response.status_code == 403
-    assert "Not enough permissions" in response.json()["detail"]
 
 
-def test_delete_contract_by_id_not_found(client, db: Session, admin_token: str):
+def test_delete_contract_by_id_not_found(client, admin_headers: dict):
     """Test deleting non-existent contract returns 404."""
     response = client.delete(
         "/api/v1/contracts/99999",
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 404
     assert "Contract not found" in response.json()["detail"]
@@ -1730,8 +1507,6 @@ def test_delete_contract_by_id_without_authentication(
     client, db: Session, tenant_user_dict: dict, apartment
 ):
     """Test deleting contract without authentication fails."""
-    from app.services.contract import create_contract
-
     contract = create_contract(
         db,
         user_id=tenant_user_dict["id"],
@@ -1745,12 +1520,9 @@ def test_delete_contract_by_id_without_authentication(
 
 
 def test_delete_contract_by_id_multiple_charges_forbidden(
-    client, db: Session, admin_token: str, tenant_user_dict: dict, apartment
+    client, db: Session, admin_headers: dict, tenant_user_dict: dict, apartment
 ):
     """Test admin cannot delete a contract with multiple charges."""
-    from app.services.contract import create_contract
-    from app.services.charge import create_charge
-
     contract = create_contract(
         db,
         user_id=tenant_user_dict["id"],
@@ -1766,17 +1538,12 @@ def test_delete_contract_by_id_multiple_charges_forbidden(
             contract_id=contract.id,
             month=month,
             year=2025,
-            rent=1000,
-            expenses=200,
-            municipal_tax=50,
-            provincial_tax=30,
-            water_bill=40,
-            is_adjusted=False,
+            **BASE_CHARGE,
         )
 
     response = client.delete(
         f"/api/v1/contracts/{contract.id}",
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 400
     assert "associated charges" in response.json()["detail"].lower()
@@ -1784,6 +1551,6 @@ def test_delete_contract_by_id_multiple_charges_forbidden(
 
     response = client.get(
         f"/api/v1/contracts/{contract.id}",
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_headers,
     )
     assert response.status_code == 200